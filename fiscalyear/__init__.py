@@ -3,7 +3,8 @@
 import calendar
 import contextlib
 import datetime
-from typing import Iterator, List, Optional, Union, cast
+import functools
+from typing import Callable, Iterator, Optional, Tuple, TypeVar, Union
 
 __author__ = "Adam J. Stewart"
 __version__ = "0.4.0"
@@ -14,6 +15,14 @@ MONTHS_PER_QUARTER = 12 // 4
 MIN_QUARTER = 1
 MAX_QUARTER = 4
 
+# Multipliers used to pack (fiscal_year, period) pairs into a single sortable int
+_QUARTER_KEY_BASE = 16
+_MONTH_KEY_BASE = 16
+_DAY_KEY_BASE = 512
+
+# Number of days in each month of a non-leap year
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 # These global variables control the start of the fiscal year.
 # The default is to use the U.S. federal government's fiscal year,
 # but they can be changed to use any other fiscal year.
@@ -21,6 +30,14 @@ START_YEAR = "previous"
 START_MONTH = 10
 START_DAY = 1
 
+# Calendar year of the first fiscal month, relative to the fiscal year
+_START_YEAR_OFFSETS = {"previous": -1, "same": 0}
+
+# Identifies a fiscal calendar, used to invalidate cached values
+_CalendarKey = Tuple[str, int, int]
+
+_T = TypeVar("_T")
+
 
 def _validate_fiscal_calendar_params(
     start_year: str, start_month: int, start_day: int
@@ -63,6 +80,7 @@ def setup_fiscal_calendar(
 
     _validate_fiscal_calendar_params(start_year, start_month, start_day)
 
+    # Cached values are keyed on the fiscal calendar, so none need clearing here
     START_YEAR = start_year
     START_MONTH = start_month
     START_DAY = start_day
@@ -84,19 +102,183 @@ def fiscal_calendar(
     :raises ValueError: If ``start_year`` is not ``'previous'`` or ``'same'``
     :raises ValueError: If ``start_month`` or ``start_day`` is out of range
     """
-    # If arguments are omitted, use the currently active values.
-    start_year = START_YEAR if start_year is None else start_year
-    start_month = START_MONTH if start_month is None else start_month
-    start_day = START_DAY if start_day is None else start_day
+    global START_YEAR, START_MONTH, START_DAY
 
     # Temporarily change global variables
+    # Omitted arguments keep their currently active values
     previous_values = (START_YEAR, START_MONTH, START_DAY)
     setup_fiscal_calendar(start_year, start_month, start_day)
 
-    yield
+    try:
+        yield
+    finally:
+        # Restore previous values, even if the body raised
+        # They were already in effect, so there is no need to validate them again
+        START_YEAR, START_MONTH, START_DAY = previous_values
+
+
+def _calendar_key() -> _CalendarKey:
+    """Return the parameters of the currently active fiscal calendar.
+
+    :returns: A ``(START_YEAR, START_MONTH, START_DAY)`` tuple
+    """
+    return (START_YEAR, START_MONTH, START_DAY)
+
+
+def _calendar_cached(
+    obj: object, slot: str, compute: Callable[[_CalendarKey], _T]
+) -> _T:
+    """Return a value cached in a slot of ``obj`` for the active fiscal calendar.
+
+    Values are stored along with the fiscal calendar they were computed for,
+    so changing the calendar makes ``compute`` run again instead of handing
+    back a stale value. An unset slot counts as empty.
+
+    :param obj: The object holding the cache
+    :param slot: The name of the slot holding the cached value
+    :param compute: Computes the value from the active calendar key
+    :returns: The cached or newly computed value
+    """
+    key = _calendar_key()
+    cached: Optional[Tuple[_CalendarKey, _T]] = getattr(obj, slot, None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    value = compute(key)
+    setattr(obj, slot, (key, value))
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _month_table(start_year: str, start_month: int) -> Tuple[Tuple[int, int], ...]:
+    """Map each fiscal month to the calendar month it starts in.
+
+    :param start_year: Relationship between the start of the fiscal year and
+        the calendar year. Possible values: ``'previous'`` or ``'same'``.
+    :param start_month: The first month of the fiscal year
+    :returns: A ``(year_offset, calendar_month)`` tuple for each fiscal month,
+        where ``year_offset`` is added to the fiscal year to get the calendar year
+    :raises ValueError: If ``start_year`` is not ``'previous'`` or ``'same'``
+    """
+    offset = _START_YEAR_OFFSETS.get(start_year)
+    if offset is None:
+        raise ValueError("START_YEAR must be either 'previous' or 'same'", start_year)
+
+    table = []
+    for fiscal_month in range(12):
+        calendar_month = (start_month - 1 + fiscal_month) % 12 + 1
+
+        # Months before the start month fall in the following calendar year
+        year_offset = offset + (calendar_month < start_month)
+        table.append((year_offset, calendar_month))
+
+    return tuple(table)
+
+
+def _fiscal_month_start(
+    fiscal_year: int,
+    fiscal_month: int,
+    start_year: str,
+    start_month: int,
+    start_day: int,
+) -> Tuple[int, int, int]:
+    """Find the calendar date that a fiscal month starts on.
+
+    Only plain integers are used, so the same arithmetic backs every
+    fiscal period regardless of the active fiscal calendar.
+
+    :param fiscal_year: The fiscal year
+    :param fiscal_month: The fiscal month
+    :param start_year: Relationship between the start of the fiscal year and
+        the calendar year. Possible values: ``'previous'`` or ``'same'``.
+    :param start_month: The first month of the fiscal year
+    :param start_day: The first day of the first month of the fiscal year
+    :returns: A ``(year, month, day)`` tuple
+    :raises ValueError: If ``start_year`` is not ``'previous'`` or ``'same'``
+    """
+    year_offset, month = _month_table(start_year, start_month)[fiscal_month - 1]
+    year = fiscal_year + year_offset
+
+    # If start_day is later than the last day of the month, choose that instead
+    day = min(start_day, _days_in_month(year, month))
+
+    return year, month, day
+
+
+@functools.lru_cache(maxsize=8192)
+def _fiscal_month_of(
+    year: int, month: int, day: int, start_year: str, start_month: int, start_day: int
+) -> Tuple[int, int]:
+    """Find the fiscal month that a calendar date falls in.
+
+    This is the inverse of :func:`_fiscal_month_start`. Checking which fiscal
+    period contains a plain date goes through here, so the check is done with
+    integers instead of building the start and end of the period.
+
+    :param year: The calendar year
+    :param month: The calendar month
+    :param day: The calendar day
+    :param start_year: Relationship between the start of the fiscal year and
+        the calendar year. Possible values: ``'previous'`` or ``'same'``.
+    :param start_month: The first month of the fiscal year
+    :param start_day: The first day of the first month of the fiscal year
+    :returns: A ``(fiscal_year, fiscal_month)`` tuple
+    :raises ValueError: If ``start_year`` is not ``'previous'`` or ``'same'``
+    """
+    # Count months from the start of year 0, so that each fiscal year is a
+    # contiguous run of 12 months and no year or month wrapping is needed
+    months = year * 12 + month - 1
+
+    # Days before the start of this month's fiscal month belong to the
+    # fiscal month that started in the previous calendar month
+    months -= day < min(start_day, _days_in_month(year, month))
+
+    # The first fiscal month starts in the fiscal year plus this offset
+    year_offset, _ = _month_table(start_year, start_month)[0]
+    fiscal_year, fiscal_month = divmod(months - start_month + 1, 12)
+
+    return fiscal_year - year_offset, fiscal_month + 1
+
+
+def _quarter_of_month(fiscal_month: int) -> int:
+    """Find the fiscal quarter that a fiscal month falls in.
+
+    :param fiscal_month: The fiscal month
+    :returns: The fiscal quarter
+    """
+    return (fiscal_month - 1) // MONTHS_PER_QUARTER + 1
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Return the number of days in a calendar month.
+
+    :param year: The calendar year
+    :param month: The calendar month
+    :returns: The last day of the month
+    """
+    if month == 2 and calendar.isleap(year):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
 
-    # Restore previous values
-    setup_fiscal_calendar(*previous_values)
+@functools.lru_cache(maxsize=None)
+def _fiscal_year_start_ordinal(
+    fiscal_year: int, start_year: str, start_month: int, start_day: int
+) -> int:
+    """Find the proleptic Gregorian ordinal that a fiscal year starts on.
+
+    :param fiscal_year: The fiscal year
+    :param start_year: Relationship between the start of the fiscal year and
+        the calendar year. Possible values: ``'previous'`` or ``'same'``.
+    :param start_month: The first month of the fiscal year
+    :param start_day: The first day of the first month of the fiscal year
+    :returns: The ordinal of the first day of the fiscal year
+    :raises ValueError: If ``start_year`` is not ``'previous'`` or ``'same'``
+    """
+    year, month, day = _fiscal_month_start(
+        fiscal_year, 1, start_year, start_month, start_day
+    )
+    return datetime.date(year, month, day).toordinal()
 
 
 def _check_year(year: int) -> int:
@@ -137,7 +319,7 @@ def _check_day(month: int, day: int) -> int:
 
     # Find the last day of the month
     # Use a non-leap year
-    max_day = calendar.monthrange(2001, month)[1]
+    max_day = _DAYS_IN_MONTH[month - 1]
 
     if 1 <= day <= max_day:
         return day
@@ -145,18 +327,28 @@ def _check_day(month: int, day: int) -> int:
         raise ValueError(f"day {day} is out of range")
 
 
+def _year_length(fiscal_year: int) -> int:
+    """Return the number of days in a fiscal year.
+
+    :param fiscal_year: The fiscal year
+    :returns: 366 if the fiscal year contains a leap day, else 365
+    """
+    # A leap day always falls in the fiscal month that starts in February
+    start_month = START_MONTH
+    year_offset, _ = _month_table(START_YEAR, start_month)[(2 - start_month) % 12]
+    return 366 if calendar.isleap(fiscal_year + year_offset) else 365
+
+
 def _check_fiscal_day(fiscal_year: int, fiscal_day: int) -> int:
     """Check if ``day`` is a valid day of the fiscal year.
 
-    :param fiscal_year: The fiscal year to test
+    :param fiscal_year: The fiscal year, already checked by :func:`_check_year`
     :param fiscal_day: The fiscal day to test
     :return: The fiscal day
-    :raises ValueError: If ``year`` or ``day`` is out of range
+    :raises ValueError: If ``day`` is out of range
     """
-    fiscal_year = _check_year(fiscal_year)
-
     # Find the length of the year
-    max_day = 366 if FiscalYear(fiscal_year).isleap else 365
+    max_day = _year_length(fiscal_year)
     if 1 <= fiscal_day <= max_day:
         return fiscal_day
     else:
@@ -176,26 +368,41 @@ def _check_quarter(quarter: int) -> int:
         raise ValueError(f"quarter {quarter} is out of range")
 
 
-class _Hashable:
-    """A class to make Fiscal objects hashable"""
+# Fiscal fields of the last date returned by FiscalDate.today()
+_TodayCache = Tuple[datetime.date, _CalendarKey, Tuple[int, int, int, int]]
+_TODAY_CACHE: Optional[_TodayCache] = None
 
-    __slots__: List[str]
 
-    def __hash__(self) -> int:
-        """Unique hash of an object instance based on __slots__
+def _today_fiscal_fields() -> Tuple[int, int, int, int]:
+    """Find the fiscal year, quarter, month and day of today's date.
 
-        :returns: a unique hash
-        """
-        return hash(tuple(map(lambda x: getattr(self, x), self.__slots__)))
+    The fields are only derived once per date and fiscal calendar, so calling
+    several ``current()`` constructors in a row just reads the clock.
+
+    :returns: A ``(fiscal_year, fiscal_quarter, fiscal_month, fiscal_day)`` tuple
+    """
+    global _TODAY_CACHE
 
+    today = FiscalDate.today()
+    key = _calendar_key()
+    if _TODAY_CACHE is not None and _TODAY_CACHE[:2] == (today, key):
+        return _TODAY_CACHE[2]
 
-class FiscalYear(_Hashable):
+    fields = today._fiscal_fields()
+    _TODAY_CACHE = (today, key, fields)
+    return fields
+
+
+class FiscalYear:
     """A class representing a single fiscal year."""
 
-    __slots__ = ["_fiscal_year"]
-    __hash__ = _Hashable.__hash__
+    __slots__ = ["_fiscal_year", "_hash", "_start", "_end", "_isleap"]
 
     _fiscal_year: int
+    _hash: int
+    _start: Optional[Tuple[_CalendarKey, "FiscalDateTime"]]
+    _end: Optional[Tuple[_CalendarKey, "FiscalDateTime"]]
+    _isleap: Optional[Tuple[_CalendarKey, bool]]
 
     def __new__(cls, fiscal_year: int) -> "FiscalYear":
         """Constructor.
@@ -208,16 +415,28 @@ class FiscalYear(_Hashable):
 
         self = super(FiscalYear, cls).__new__(cls)
         self._fiscal_year = fiscal_year
+        # Tag the hash with the class so it never matches the bare int
+        self._hash = hash((FiscalYear, fiscal_year))
+        self._start = None
+        self._end = None
+        self._isleap = None
         return self
 
+    def __hash__(self) -> int:
+        """Unique hash of an object instance based on its fiscal year
+
+        :returns: a unique hash
+        """
+        return self._hash
+
     @classmethod
     def current(cls) -> "FiscalYear":
         """Alternative constructor. Returns the current FiscalYear.
 
         :returns: A newly constructed FiscalYear object
         """
-        today = FiscalDate.today()
-        return cls(today.fiscal_year)
+        fiscal_year, _, _, _ = _today_fiscal_fields()
+        return cls(fiscal_year)
 
     def __repr__(self) -> str:
         """Convert to formal string, for repr().
@@ -254,14 +473,16 @@ class FiscalYear(_Hashable):
         """:param item: The item to check
         :returns: True if item in self, else False
         """
-        if isinstance(item, FiscalYear):
-            return self == item
-        elif isinstance(item, (FiscalQuarter, FiscalMonth, FiscalDay)):
-            return self._fiscal_year == item.fiscal_year
+        # Every fiscal period carries its fiscal year, so no dates are needed
+        if isinstance(item, (FiscalYear, FiscalQuarter, FiscalMonth, FiscalDay)):
+            return self._fiscal_year == item._fiscal_year
         elif isinstance(item, datetime.datetime):
             return self.start <= item <= self.end
         else:
-            return self.start.date() <= item <= self.end.date()
+            fiscal_year, _ = _fiscal_month_of(
+                item.year, item.month, item.day, *_calendar_key()
+            )
+            return self._fiscal_year == fiscal_year
 
     # Read-only field accessors
 
@@ -283,12 +504,12 @@ class FiscalYear(_Hashable):
     @property
     def start(self) -> "FiscalDateTime":
         """:returns: Start of the fiscal year"""
-        return self.q1.start
+        return _calendar_cached(self, "_start", lambda key: self.q1.start)
 
     @property
     def end(self) -> "FiscalDateTime":
         """:returns: End of the fiscal year"""
-        return self.q4.end
+        return _calendar_cached(self, "_end", lambda key: self.q4.end)
 
     @property
     def q1(self) -> "FiscalQuarter":
@@ -313,24 +534,9 @@ class FiscalYear(_Hashable):
     @property
     def isleap(self) -> bool:
         """returns: True if the fiscal year contains a leap day, else False"""
-        fiscal_year = FiscalYear(self._fiscal_year)
-        starts_on_or_before_possible_leap_day = (
-            fiscal_year.start.month,
-            fiscal_year.start.day,
-        ) < (3, 1)
-
-        if START_YEAR == "previous":
-            if starts_on_or_before_possible_leap_day:
-                calendar_year = self._fiscal_year - 1
-            else:
-                calendar_year = self._fiscal_year
-        elif START_YEAR == "same":
-            if starts_on_or_before_possible_leap_day:
-                calendar_year = self._fiscal_year
-            else:
-                calendar_year = self._fiscal_year + 1
-
-        return calendar.isleap(calendar_year)
+        return _calendar_cached(
+            self, "_isleap", lambda key: _year_length(self._fiscal_year) == 366
+        )
 
     # Comparisons of FiscalYear objects with other
 
@@ -342,7 +548,7 @@ class FiscalYear(_Hashable):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, FiscalYear):
-            return self._fiscal_year == other._fiscal_year
+            return self is other or self._fiscal_year == other._fiscal_year
         else:
             raise TypeError(
                 f"can't compare '{type(self).__name__}' to '{type(other).__name__}'"
@@ -350,7 +556,7 @@ class FiscalYear(_Hashable):
 
     def __ne__(self, other: object) -> bool:
         if isinstance(other, FiscalYear):
-            return self._fiscal_year != other._fiscal_year
+            return self is not other and self._fiscal_year != other._fiscal_year
         else:
             raise TypeError(
                 f"can't compare '{type(self).__name__}' to '{type(other).__name__}'"
@@ -363,14 +569,24 @@ class FiscalYear(_Hashable):
         return self._fiscal_year >= other._fiscal_year
 
 
-class FiscalQuarter(_Hashable):
+class FiscalQuarter:
     """A class representing a single fiscal quarter."""
 
-    __slots__ = ["_fiscal_year", "_fiscal_quarter"]
-    __hash__ = _Hashable.__hash__
+    __slots__ = [
+        "_fiscal_year",
+        "_fiscal_quarter",
+        "_sort_key",
+        "_hash",
+        "_start",
+        "_end",
+    ]
 
     _fiscal_year: int
     _fiscal_quarter: int
+    _sort_key: int
+    _hash: int
+    _start: Optional[Tuple[_CalendarKey, "FiscalDateTime"]]
+    _end: Optional[Tuple[_CalendarKey, "FiscalDateTime"]]
 
     def __new__(cls, fiscal_year: int, fiscal_quarter: int) -> "FiscalQuarter":
         """Constructor.
@@ -386,16 +602,28 @@ class FiscalQuarter(_Hashable):
         self = super(FiscalQuarter, cls).__new__(cls)
         self._fiscal_year = fiscal_year
         self._fiscal_quarter = fiscal_quarter
+        self._sort_key = fiscal_year * _QUARTER_KEY_BASE + fiscal_quarter
+        # Tag the hash with the class so it never matches the bare packed int
+        self._hash = hash((FiscalQuarter, self._sort_key))
+        self._start = None
+        self._end = None
         return self
 
+    def __hash__(self) -> int:
+        """Unique hash of an object instance based on its fiscal year and quarter
+
+        :returns: a unique hash
+        """
+        return self._hash
+
     @classmethod
     def current(cls) -> "FiscalQuarter":
         """Alternative constructor. Returns the current FiscalQuarter.
 
         :returns: A newly constructed FiscalQuarter object
         """
-        today = FiscalDate.today()
-        return cls(today.fiscal_year, today.fiscal_quarter)
+        fiscal_year, fiscal_quarter, _, _ = _today_fiscal_fields()
+        return cls(fiscal_year, fiscal_quarter)
 
     def __repr__(self) -> str:
         """Convert to formal string, for repr().
@@ -434,12 +662,23 @@ class FiscalQuarter(_Hashable):
         """
         if isinstance(item, FiscalQuarter):
             return self == item
-        elif isinstance(item, (FiscalMonth, FiscalDay)):
+        elif isinstance(item, FiscalMonth):
+            return (
+                self._fiscal_year == item._fiscal_year
+                and self._fiscal_quarter == _quarter_of_month(item._fiscal_month)
+            )
+        elif isinstance(item, FiscalDay):
             return self.start <= item.start and item.end <= self.end
         elif isinstance(item, datetime.datetime):
             return self.start <= item <= self.end
         elif isinstance(item, datetime.date):
-            return self.start.date() <= item <= self.end.date()
+            fiscal_year, fiscal_month = _fiscal_month_of(
+                item.year, item.month, item.day, *_calendar_key()
+            )
+            return (
+                self._fiscal_year == fiscal_year
+                and self._fiscal_quarter == _quarter_of_month(fiscal_month)
+            )
 
     # Read-only field accessors
 
@@ -453,99 +692,64 @@ class FiscalQuarter(_Hashable):
         """:returns: The fiscal quarter"""
         return self._fiscal_quarter
 
+    def _offset_quarter(self, delta: int) -> "FiscalQuarter":
+        """Shift the fiscal quarter, wrapping around fiscal year boundaries.
+
+        :param delta: The number of fiscal quarters to shift by
+        :returns: The shifted fiscal quarter
+        """
+        quarters = self._fiscal_year * MAX_QUARTER + self._fiscal_quarter - 1 + delta
+        fiscal_year, fiscal_quarter = divmod(quarters, MAX_QUARTER)
+
+        return FiscalQuarter(fiscal_year, fiscal_quarter + 1)
+
     @property
     def prev_fiscal_quarter(self) -> "FiscalQuarter":
         """:returns: The previous fiscal quarter"""
-        fiscal_year = self._fiscal_year
-        fiscal_quarter = self._fiscal_quarter - 1
-        if fiscal_quarter == 0:
-            fiscal_year -= 1
-            fiscal_quarter = 4
-
-        return FiscalQuarter(fiscal_year, fiscal_quarter)
+        return self._offset_quarter(-1)
 
     @property
     def next_fiscal_quarter(self) -> "FiscalQuarter":
         """:returns: The next fiscal quarter"""
-        fiscal_year = self._fiscal_year
-        fiscal_quarter = self._fiscal_quarter + 1
-        if fiscal_quarter == 5:
-            fiscal_year += 1
-            fiscal_quarter = 1
-
-        return FiscalQuarter(fiscal_year, fiscal_quarter)
+        return self._offset_quarter(1)
 
     @property
     def start(self) -> "FiscalDateTime":
         """:returns: The start of the fiscal quarter"""
 
-        # Find the first month of the fiscal quarter
-        month = START_MONTH
-        month += (self._fiscal_quarter - 1) * MONTHS_PER_QUARTER
-        month %= 12
-        if month == 0:
-            month = 12
-
-        # Find the calendar year of the start of the fiscal quarter
-        if START_YEAR == "previous":
-            year = self._fiscal_year - 1
-        elif START_YEAR == "same":
-            year = self._fiscal_year
-        else:
-            raise ValueError(
-                "START_YEAR must be either 'previous' or 'same'", START_YEAR
+        def compute(key: _CalendarKey) -> "FiscalDateTime":
+            # Find the first month of the fiscal quarter
+            fiscal_month = (self._fiscal_quarter - 1) * MONTHS_PER_QUARTER + 1
+            # The calendar key already holds the globals, so don't look them up again
+            year, month, day = _fiscal_month_start(
+                self._fiscal_year, fiscal_month, *key
             )
+            return FiscalDateTime(year, month, day)
 
-        if month < START_MONTH:
-            year += 1
-
-        # Find the last day of the month
-        # If START_DAY is later, choose last day of month instead
-        max_day = calendar.monthrange(year, month)[1]
-        day = min(START_DAY, max_day)
-
-        return FiscalDateTime(year, month, day, 0, 0, 0)
+        return _calendar_cached(self, "_start", compute)
 
     @property
     def end(self) -> "FiscalDateTime":
         """:returns: The end of the fiscal quarter"""
-        # Find the start of the next fiscal quarter
-        next_start = self.next_fiscal_quarter.start
-
-        # Substract 1 second
-        end = next_start - datetime.timedelta(seconds=1)
-
-        return FiscalDateTime(
-            end.year,
-            end.month,
-            end.day,
-            end.hour,
-            end.minute,
-            end.second,
-            end.microsecond,
-            end.tzinfo,
-        )
+
+        def compute(key: _CalendarKey) -> "FiscalDateTime":
+            # Substract 1 second from the start of the next period
+            # Arithmetic on a FiscalDateTime already returns a FiscalDateTime
+            return self.next_fiscal_quarter.start - datetime.timedelta(seconds=1)
+
+        return _calendar_cached(self, "_end", compute)
 
     # Comparisons of FiscalQuarter objects with other
 
     def __lt__(self, other: "FiscalQuarter") -> bool:
-        return (self._fiscal_year, self._fiscal_quarter) < (
-            other._fiscal_year,
-            other._fiscal_quarter,
-        )
+        return self._sort_key < other._sort_key
 
     def __le__(self, other: "FiscalQuarter") -> bool:
-        return (self._fiscal_year, self._fiscal_quarter) <= (
-            other._fiscal_year,
-            other._fiscal_quarter,
-        )
+        return self._sort_key <= other._sort_key
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, FiscalQuarter):
-            return (self._fiscal_year, self._fiscal_quarter) == (
-                other._fiscal_year,
-                other._fiscal_quarter,
-            )
+            return self is other or self._sort_key == other._sort_key
         else:
             raise TypeError(
                 f"can't compare '{type(self).__name__}' to '{type(other).__name__}'"
@@ -553,36 +757,37 @@ class FiscalQuarter(_Hashable):
 
     def __ne__(self, other: object) -> bool:
         if isinstance(other, FiscalQuarter):
-            return (self._fiscal_year, self._fiscal_quarter) != (
-                other._fiscal_year,
-                other._fiscal_quarter,
-            )
+            return self is not other and self._sort_key != other._sort_key
         else:
             raise TypeError(
                 f"can't compare '{type(self).__name__}' to '{type(other).__name__}'"
             )
 
     def __gt__(self, other: "FiscalQuarter") -> bool:
-        return (self._fiscal_year, self._fiscal_quarter) > (
-            other._fiscal_year,
-            other._fiscal_quarter,
-        )
+        return self._sort_key > other._sort_key
 
     def __ge__(self, other: "FiscalQuarter") -> bool:
-        return (self._fiscal_year, self._fiscal_quarter) >= (
-            other._fiscal_year,
-            other._fiscal_quarter,
-        )
+        return self._sort_key >= other._sort_key
 
 
-class FiscalMonth(_Hashable):
+class FiscalMonth:
     """A class representing a single fiscal month."""
 
-    __slots__ = ["_fiscal_year", "_fiscal_month"]
-    __hash__ = _Hashable.__hash__
+    __slots__ = [
+        "_fiscal_year",
+        "_fiscal_month",
+        "_sort_key",
+        "_hash",
+        "_start",
+        "_end",
+    ]
 
     _fiscal_year: int
     _fiscal_month: int
+    _sort_key: int
+    _hash: int
+    _start: Optional[Tuple[_CalendarKey, "FiscalDateTime"]]
+    _end: Optional[Tuple[_CalendarKey, "FiscalDateTime"]]
 
     def __new__(cls, fiscal_year: int, fiscal_month: int) -> "FiscalMonth":
         """Constructor.
@@ -598,16 +803,28 @@ class FiscalMonth(_Hashable):
         self = super(FiscalMonth, cls).__new__(cls)
         self._fiscal_year = fiscal_year
         self._fiscal_month = fiscal_month
+        self._sort_key = fiscal_year * _MONTH_KEY_BASE + fiscal_month
+        # Tag the hash with the class so it never matches the bare packed int
+        self._hash = hash((FiscalMonth, self._sort_key))
+        self._start = None
+        self._end = None
         return self
 
+    def __hash__(self) -> int:
+        """Unique hash of an object instance based on its fiscal year and month
+
+        :returns: a unique hash
+        """
+        return self._hash
+
     @classmethod
     def current(cls) -> "FiscalMonth":
         """Alternative constructor. Returns the current FiscalMonth.
 
         :returns: A newly constructed FiscalMonth object
         """
-        today = FiscalDate.today()
-        return cls(today.fiscal_year, today.fiscal_month)
+        fiscal_year, _, fiscal_month, _ = _today_fiscal_fields()
+        return cls(fiscal_year, fiscal_month)
 
     def __repr__(self) -> str:
         """Convert to formal string, for repr().
@@ -644,7 +861,12 @@ class FiscalMonth(_Hashable):
         elif isinstance(item, datetime.datetime):
             return self.start <= item <= self.end
         elif isinstance(item, datetime.date):
-            return self.start.date() <= item <= self.end.date()
+            fiscal_year, fiscal_month = _fiscal_month_of(
+                item.year, item.month, item.day, *_calendar_key()
+            )
+            return (
+                self._fiscal_year == fiscal_year and self._fiscal_month == fiscal_month
+            )
 
     # Read-only field accessors
 
@@ -662,87 +884,58 @@ class FiscalMonth(_Hashable):
     def start(self) -> "FiscalDateTime":
         """:returns: Start of the fiscal month"""
 
-        calendar_month = (START_MONTH + self._fiscal_month - 1) % 12
-        if calendar_month == 0:
-            calendar_month = 12
-
-        month_is_on_or_after_start_month = calendar_month >= START_MONTH
-
-        if START_YEAR == "previous":
-            if month_is_on_or_after_start_month:
-                calendar_year = self._fiscal_year - 1
-            else:
-                calendar_year = self._fiscal_year
-        elif START_YEAR == "same":
-            if month_is_on_or_after_start_month:
-                calendar_year = self._fiscal_year
-            else:
-                calendar_year = self._fiscal_year + 1
+        def compute(key: _CalendarKey) -> "FiscalDateTime":
+            # The calendar key already holds the globals, so don't look them up again
+            year, month, day = _fiscal_month_start(
+                self._fiscal_year, self._fiscal_month, *key
+            )
+            return FiscalDateTime(year, month, day)
 
-        return FiscalDateTime(calendar_year, calendar_month, START_DAY)
+        return _calendar_cached(self, "_start", compute)
 
     @property
     def end(self) -> "FiscalDateTime":
         """:returns: End of the fiscal month"""
-        # Find the start of the next fiscal quarter
-        next_start = self.next_fiscal_month.start
-
-        # Substract 1 second
-        end = next_start - datetime.timedelta(seconds=1)
-
-        return FiscalDateTime(
-            end.year,
-            end.month,
-            end.day,
-            end.hour,
-            end.minute,
-            end.second,
-            end.microsecond,
-            end.tzinfo,
-        )
+
+        def compute(key: _CalendarKey) -> "FiscalDateTime":
+            # Substract 1 second from the start of the next period
+            # Arithmetic on a FiscalDateTime already returns a FiscalDateTime
+            return self.next_fiscal_month.start - datetime.timedelta(seconds=1)
+
+        return _calendar_cached(self, "_end", compute)
+
+    def _offset_month(self, delta: int) -> "FiscalMonth":
+        """Shift the fiscal month, wrapping around fiscal year boundaries.
+
+        :param delta: The number of fiscal months to shift by
+        :returns: The shifted fiscal month
+        """
+        months = self._fiscal_year * 12 + self._fiscal_month - 1 + delta
+        fiscal_year, fiscal_month = divmod(months, 12)
+
+        return FiscalMonth(fiscal_year, fiscal_month + 1)
 
     @property
     def prev_fiscal_month(self) -> "FiscalMonth":
         """:returns: The previous fiscal month"""
-        fiscal_year = self._fiscal_year
-        fiscal_month = self._fiscal_month - 1
-        if fiscal_month == 0:
-            fiscal_year -= 1
-            fiscal_month = 12
-
-        return FiscalMonth(fiscal_year, fiscal_month)
+        return self._offset_month(-1)
 
     @property
     def next_fiscal_month(self) -> "FiscalMonth":
         """:returns: The next fiscal month"""
-        fiscal_year = self._fiscal_year
-        fiscal_month = self._fiscal_month + 1
-        if fiscal_month == 13:
-            fiscal_year += 1
-            fiscal_month = 1
-
-        return FiscalMonth(fiscal_year, fiscal_month)
+        return self._offset_month(1)
 
     # Comparisons of FiscalMonth objects with other
 
     def __lt__(self, other: "FiscalMonth") -> bool:
-        return (self._fiscal_year, self._fiscal_month) < (
-            other._fiscal_year,
-            other._fiscal_month,
-        )
+        return self._sort_key < other._sort_key
 
     def __le__(self, other: "FiscalMonth") -> bool:
-        return (self._fiscal_year, self._fiscal_month) <= (
-            other._fiscal_year,
-            other._fiscal_month,
-        )
+        return self._sort_key <= other._sort_key
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, FiscalMonth):
-            return (self._fiscal_year, self._fiscal_month) == (
-                other._fiscal_year,
-                other._fiscal_month,
-            )
+            return self is other or self._sort_key == other._sort_key
         else:
             raise TypeError(
                 f"can't compare '{type(self).__name__}' to '{type(other).__name__}'"
@@ -750,36 +943,30 @@ class FiscalMonth(_Hashable):
 
     def __ne__(self, other: object) -> bool:
         if isinstance(other, FiscalMonth):
-            return (self._fiscal_year, self._fiscal_month) != (
-                other._fiscal_year,
-                other._fiscal_month,
-            )
+            return self is not other and self._sort_key != other._sort_key
         else:
             raise TypeError(
                 f"can't compare '{type(self).__name__}' to '{type(other).__name__}'"
             )
 
     def __gt__(self, other: "FiscalMonth") -> bool:
-        return (self._fiscal_year, self._fiscal_month) > (
-            other._fiscal_year,
-            other._fiscal_month,
-        )
+        return self._sort_key > other._sort_key
 
     def __ge__(self, other: "FiscalMonth") -> bool:
-        return (self._fiscal_year, self._fiscal_month) >= (
-            other._fiscal_year,
-            other._fiscal_month,
-        )
+        return self._sort_key >= other._sort_key
 
 
-class FiscalDay(_Hashable):
+class FiscalDay:
     """A class representing a single fiscal day."""
 
-    __slots__ = ["_fiscal_year", "_fiscal_day"]
-    __hash__ = _Hashable.__hash__
+    __slots__ = ["_fiscal_year", "_fiscal_day", "_sort_key", "_hash", "_start", "_end"]
 
     _fiscal_year: int
     _fiscal_day: int
+    _sort_key: int
+    _hash: int
+    _start: Optional[Tuple[_CalendarKey, "FiscalDateTime"]]
+    _end: Optional[Tuple[_CalendarKey, "FiscalDateTime"]]
 
     def __new__(cls, fiscal_year: int, fiscal_day: int) -> "FiscalDay":
         """Constructor.
@@ -791,20 +978,70 @@ class FiscalDay(_Hashable):
         """
         fiscal_year = _check_year(fiscal_year)
         fiscal_day = _check_fiscal_day(fiscal_year, fiscal_day)
+        return cls._unchecked(fiscal_year, fiscal_day)
+
+    @classmethod
+    def _unchecked(cls, fiscal_year: int, fiscal_day: int) -> "FiscalDay":
+        """Construct a FiscalDay from values that are already known to be valid.
 
+        :param fiscal_year: The fiscal year
+        :param fiscal_day: The fiscal day
+        :returns: A newly constructed FiscalDay object
+        """
         self = super(FiscalDay, cls).__new__(cls)
         self._fiscal_year = fiscal_year
         self._fiscal_day = fiscal_day
+        self._sort_key = fiscal_year * _DAY_KEY_BASE + fiscal_day
+        # Tag the hash with the class so it never matches the bare packed int
+        self._hash = hash((FiscalDay, self._sort_key))
+        self._start = None
+        self._end = None
         return self
 
+    def __hash__(self) -> int:
+        """Unique hash of an object instance based on its fiscal year and day
+
+        :returns: a unique hash
+        """
+        return self._hash
+
     @classmethod
     def current(cls) -> "FiscalDay":
         """Alternative constructor. Returns the current FiscalDay.
 
         :returns: A newly constructed FiscalDay object
         """
-        today = FiscalDate.today()
-        return cls(today.fiscal_year, today.fiscal_day)
+        fiscal_year, _, _, fiscal_day = _today_fiscal_fields()
+        return cls(fiscal_year, fiscal_day)
+
+    @classmethod
+    def range(cls, start: "FiscalDay", stop: "FiscalDay") -> Iterator["FiscalDay"]:
+        """Yields each fiscal day from ``start`` up to, but not including, ``stop``.
+
+        Only ``start`` is checked against the current fiscal calendar. The
+        length of each fiscal year is then looked up once, instead of
+        validating every fiscal day as it is constructed.
+
+        >>> list(FiscalDay.range(FiscalDay(2017, 365), FiscalDay(2018, 2)))
+        [FiscalDay(2017, 365), FiscalDay(2018, 1)]
+
+        :param start: The first fiscal day
+        :param stop: The fiscal day to stop at, which is not included
+        :returns: An iterator of newly constructed FiscalDay objects
+        :raises ValueError: If ``start`` is out of range for the fiscal calendar
+        """
+        fiscal_year = start._fiscal_year
+        fiscal_day = _check_fiscal_day(fiscal_year, start._fiscal_day)
+        year_length = _year_length(fiscal_year)
+
+        while fiscal_year * _DAY_KEY_BASE + fiscal_day < stop._sort_key:
+            yield cls._unchecked(fiscal_year, fiscal_day)
+
+            fiscal_day += 1
+            if fiscal_day > year_length:
+                fiscal_year += 1
+                fiscal_day = 1
+                year_length = _year_length(fiscal_year)
 
     def __repr__(self) -> str:
         """Convert to formal string, for repr().
@@ -839,7 +1076,8 @@ class FiscalDay(_Hashable):
         elif isinstance(item, datetime.datetime):
             return self.start <= item <= self.end
         elif isinstance(item, datetime.date):
-            return self.start.date() <= item <= self.end.date()
+            # A fiscal day covers exactly one calendar date
+            return item.toordinal() == self.start.toordinal()
 
     # Read-only field accessors
 
@@ -867,30 +1105,23 @@ class FiscalDay(_Hashable):
     def start(self) -> "FiscalDateTime":
         """:returns: Start of the fiscal day"""
 
-        fiscal_year = FiscalYear(self._fiscal_year)
-        days_elapsed = datetime.timedelta(days=self._fiscal_day - 1)
-        start = fiscal_year.start + days_elapsed
-        return FiscalDateTime(start.year, start.month, start.day, 0, 0, 0)
+        def compute(key: _CalendarKey) -> "FiscalDateTime":
+            # Count days from the start of the fiscal year as plain integers
+            ordinal = _fiscal_year_start_ordinal(self._fiscal_year, *key)
+            return FiscalDateTime.fromordinal(ordinal + self._fiscal_day - 1)
+
+        return _calendar_cached(self, "_start", compute)
 
     @property
     def end(self) -> "FiscalDateTime":
         """:returns: End of the fiscal day"""
-        # Find the start of the next fiscal quarter
-        next_start = self.next_fiscal_day.start
-
-        # Substract 1 second
-        end = next_start - datetime.timedelta(seconds=1)
-
-        return FiscalDateTime(
-            end.year,
-            end.month,
-            end.day,
-            end.hour,
-            end.minute,
-            end.second,
-            end.microsecond,
-            end.tzinfo,
-        )
+
+        def compute(key: _CalendarKey) -> "FiscalDateTime":
+            # Substract 1 second from the start of the next period
+            # Arithmetic on a FiscalDateTime already returns a FiscalDateTime
+            return self.next_fiscal_day.start - datetime.timedelta(seconds=1)
+
+        return _calendar_cached(self, "_end", compute)
 
     @property
     def prev_fiscal_day(self) -> "FiscalDay":
@@ -899,10 +1130,7 @@ class FiscalDay(_Hashable):
         fiscal_day = self._fiscal_day - 1
         if fiscal_day == 0:
             fiscal_year -= 1
-            try:
-                fiscal_day = _check_fiscal_day(fiscal_year, 366)
-            except ValueError:
-                fiscal_day = _check_fiscal_day(fiscal_year, 365)
+            fiscal_day = _year_length(fiscal_year)
 
         return FiscalDay(fiscal_year, fiscal_day)
 
@@ -910,9 +1138,8 @@ class FiscalDay(_Hashable):
     def next_fiscal_day(self) -> "FiscalDay":
         """:returns: The next fiscal day"""
         fiscal_year = self._fiscal_year
-        try:
-            fiscal_day = _check_fiscal_day(fiscal_year, self._fiscal_day + 1)
-        except ValueError:
+        fiscal_day = self._fiscal_day + 1
+        if fiscal_day > _year_length(fiscal_year):
             fiscal_year += 1
             fiscal_day = 1
 
@@ -921,23 +1148,14 @@ class FiscalDay(_Hashable):
     # Comparisons of FiscalDay objects with other
 
     def __lt__(self, other: "FiscalDay") -> bool:
-        return (self._fiscal_year, self._fiscal_day) < (
-            other._fiscal_year,
-            other._fiscal_day,
-        )
+        return self._sort_key < other._sort_key
 
     def __le__(self, other: "FiscalDay") -> bool:
-        return (self._fiscal_year, self._fiscal_day) <= (
-            other._fiscal_year,
-            other._fiscal_day,
-        )
+        return self._sort_key <= other._sort_key
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, FiscalDay):
-            return (self._fiscal_year, self._fiscal_day) == (
-                other._fiscal_year,
-                other._fiscal_day,
-            )
+            return self is other or self._sort_key == other._sort_key
         else:
             raise TypeError(
                 f"can't compare '{type(self).__name__}' to '{type(other).__name__}'"
@@ -945,26 +1163,20 @@ class FiscalDay(_Hashable):
 
     def __ne__(self, other: object) -> bool:
         if isinstance(other, FiscalDay):
-            return (self._fiscal_year, self._fiscal_day) != (
-                other._fiscal_year,
-                other._fiscal_day,
-            )
+            return self is not other and self._sort_key != other._sort_key
         else:
             raise TypeError(
                 f"can't compare '{type(self).__name__}' to '{type(other).__name__}'"
             )
 
     def __gt__(self, other: "FiscalDay") -> bool:
-        return (self._fiscal_year, self._fiscal_day) > (
-            other._fiscal_year,
-            other._fiscal_day,
-        )
+        return self._sort_key > other._sort_key
 
     def __ge__(self, other: "FiscalDay") -> bool:
-        return (self._fiscal_year, self._fiscal_day) >= (
-            other._fiscal_year,
-            other._fiscal_day,
-        )
+        return self._sort_key >= other._sort_key
+
+
+_AnyFiscalDate = Union["FiscalDate", "FiscalDateTime"]
 
 
 class _FiscalMixin:
@@ -973,55 +1185,52 @@ class _FiscalMixin:
     those provided by datetime.date and datetime.datetime:
     """
 
+    # The slots themselves are declared by FiscalDate and FiscalDateTime, since a
+    # mixin with slots can't share an instance layout with datetime.date
+    __slots__ = ()
+
+    # Fiscal fields are cached along with the fiscal calendar they belong to,
+    # and are left unset until first used
+    _fields: Optional[Tuple[_CalendarKey, Tuple[int, int, int, int]]]
+
+    def _fiscal_fields(self) -> Tuple[int, int, int, int]:
+        """:returns: The fiscal year, quarter, month and day, computed together"""
+        # A plain rebind tells the type checker what self is without typing.cast
+        fiscal_self: _AnyFiscalDate = self  # type: ignore[assignment]
+
+        def compute(key: _CalendarKey) -> Tuple[int, int, int, int]:
+            fiscal_year, fiscal_month = _fiscal_month_of(
+                fiscal_self.year, fiscal_self.month, fiscal_self.day, *key
+            )
+            fiscal_quarter = _quarter_of_month(fiscal_month)
+
+            # Whole days since the start of the fiscal year, ignoring any time of day
+            start = _fiscal_year_start_ordinal(fiscal_year, *key)
+            fiscal_day = fiscal_self.toordinal() - start + 1
+
+            return (fiscal_year, fiscal_quarter, fiscal_month, fiscal_day)
+
+        return _calendar_cached(self, "_fields", compute)
+
     @property
     def fiscal_year(self) -> int:
         """:returns: The fiscal year"""
-
-        fiscal_self = cast(Union["FiscalDate", "FiscalDateTime"], self)
-
-        # The fiscal year can be at most 1 year away from the calendar year
-        if fiscal_self in FiscalYear(fiscal_self.year):
-            return fiscal_self.year
-        elif fiscal_self in FiscalYear(fiscal_self.year + 1):
-            return fiscal_self.year + 1
-        else:
-            return fiscal_self.year - 1
+        return self._fiscal_fields()[0]
 
     @property
     def fiscal_quarter(self) -> int:
         """:returns: The fiscal quarter"""
-        fiscal_self = cast(Union["FiscalDate", "FiscalDateTime"], self)
-        for quarter in range(1, 5):
-            q = FiscalQuarter(fiscal_self.fiscal_year, quarter)
-            if fiscal_self in q:
-                break
-        return quarter
+        return self._fiscal_fields()[1]
 
     @property
     def fiscal_month(self) -> int:
         """:returns: The fiscal month"""
-        fiscal_self = cast(Union["FiscalDate", "FiscalDateTime"], self)
-        for month in range(1, 13):
-            m = FiscalMonth(fiscal_self.fiscal_year, month)
-            if fiscal_self in m:
-                break
-        return month
+        return self._fiscal_fields()[2]
 
     @property
     def fiscal_day(self) -> int:
         """:returns: The fiscal day"""
-
-        fiscal_self = cast(Union["FiscalDate", "FiscalDateTime"], self)
-
-        fiscal_year = FiscalYear(fiscal_self.fiscal_year)
-        year_start = fiscal_year.start
-
-        if isinstance(fiscal_self, FiscalDate):
-            delta = cast(datetime.date, fiscal_self) - year_start.date()
-        else:
-            delta = fiscal_self - year_start
-
-        return delta.days + 1
+        return self._fiscal_fields()[3]
 
     @property
     def prev_fiscal_year(self) -> FiscalYear:
@@ -1036,55 +1245,71 @@ class _FiscalMixin:
     @property
     def prev_fiscal_quarter(self) -> FiscalQuarter:
         """:returns: The previous fiscal quarter"""
-        fiscal_quarter = FiscalQuarter(self.fiscal_year, self.fiscal_quarter)
+        fiscal_year, fiscal_quarter, _, _ = self._fiscal_fields()
+        if fiscal_quarter == MIN_QUARTER:
+            return FiscalQuarter(fiscal_year - 1, MAX_QUARTER)
 
-        return fiscal_quarter.prev_fiscal_quarter
+        return FiscalQuarter(fiscal_year, fiscal_quarter - 1)
 
     @property
     def next_fiscal_quarter(self) -> FiscalQuarter:
         """:returns: The next fiscal quarter"""
-        fiscal_quarter = FiscalQuarter(self.fiscal_year, self.fiscal_quarter)
+        fiscal_year, fiscal_quarter, _, _ = self._fiscal_fields()
+        if fiscal_quarter == MAX_QUARTER:
+            return FiscalQuarter(fiscal_year + 1, MIN_QUARTER)
 
-        return fiscal_quarter.next_fiscal_quarter
+        return FiscalQuarter(fiscal_year, fiscal_quarter + 1)
 
     @property
     def prev_fiscal_month(self) -> FiscalMonth:
         """:returns: The previous fiscal month"""
-        fiscal_month = FiscalMonth(self.fiscal_year, self.fiscal_month)
+        fiscal_year, _, fiscal_month, _ = self._fiscal_fields()
+        if fiscal_month == 1:
+            return FiscalMonth(fiscal_year - 1, 12)
 
-        return fiscal_month.prev_fiscal_month
+        return FiscalMonth(fiscal_year, fiscal_month - 1)
 
     @property
     def next_fiscal_month(self) -> FiscalMonth:
         """:returns: The next fiscal month"""
-        fiscal_month = FiscalMonth(self.fiscal_year, self.fiscal_month)
+        fiscal_year, _, fiscal_month, _ = self._fiscal_fields()
+        if fiscal_month == 12:
+            return FiscalMonth(fiscal_year + 1, 1)
 
-        return fiscal_month.next_fiscal_month
+        return FiscalMonth(fiscal_year, fiscal_month + 1)
 
     @property
     def prev_fiscal_day(self) -> FiscalDay:
         """:returns: The previous fiscal day"""
-        fiscal_day = FiscalDay(self.fiscal_year, self.fiscal_day)
+        fiscal_year, _, _, fiscal_day = self._fiscal_fields()
+        fiscal_day -= 1
+        if fiscal_day == 0:
+            fiscal_year -= 1
+            fiscal_day = _year_length(fiscal_year)
 
-        return fiscal_day.prev_fiscal_day
+        return FiscalDay(fiscal_year, fiscal_day)
 
     @property
     def next_fiscal_day(self) -> FiscalDay:
         """:returns: The next fiscal day"""
-        fiscal_day = FiscalDay(self.fiscal_year, self.fiscal_day)
+        fiscal_year, _, _, fiscal_day = self._fiscal_fields()
+        fiscal_day += 1
+        if fiscal_day > _year_length(fiscal_year):
+            fiscal_year += 1
+            fiscal_day = 1
 
-        return fiscal_day.next_fiscal_day
+        return FiscalDay(fiscal_year, fiscal_day)
 
 
 class FiscalDate(datetime.date, _FiscalMixin):
     """A wrapper around the builtin datetime.date class
     that provides the following attributes."""
 
-    pass
+    __slots__ = ["_fields"]
 
 
 class FiscalDateTime(datetime.datetime, _FiscalMixin):
     """A wrapper around the builtin datetime.datetime class
     that provides the following attributes."""
 
-    pass
+    __slots__ = ["_fields"]
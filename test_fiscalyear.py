@@ -1,4 +1,7 @@
 import datetime
+import itertools
+import operator
+from typing import Any, Callable, Iterator
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
@@ -14,109 +17,362 @@ from fiscalyear import (
 )
 
 # Fiscal calendars to test
-US_FEDERAL = ("previous", 10, 1)
-UK_PERSONAL = ("same", 4, 6)
+Calendar = tuple[str, int, int]
+US_FEDERAL: Calendar = ("previous", 10, 1)
+UK_PERSONAL: Calendar = ("same", 4, 6)
+
+# Fiscal period boundaries shared by several tests
+US_FY2016_START = datetime.datetime(2015, 10, 1, 0, 0, 0)
+US_FY2016_END = datetime.datetime(2016, 9, 30, 23, 59, 59)
+US_FY2017_START = datetime.datetime(2016, 10, 1, 0, 0, 0)
+US_FY2017_Q1_END = datetime.datetime(2016, 12, 31, 23, 59, 59)
+UK_FY2016_START = datetime.datetime(2016, 4, 6, 0, 0, 0)
+UK_FY2016_END = datetime.datetime(2017, 4, 5, 23, 59, 59)
+UK_FY2017_START = datetime.datetime(2017, 4, 6, 0, 0, 0)
+UK_FY2017_Q1_END = datetime.datetime(2017, 7, 5, 23, 59, 59)
+UK_FY2016_M12_START = datetime.datetime(2017, 3, 6, 0, 0, 0)
+
+# Expected (start, end) of FY2016 and of each quarter of FY2017 in each calendar
+YEAR_BOUNDS = {
+    US_FEDERAL: (US_FY2016_START, US_FY2016_END),
+    UK_PERSONAL: (UK_FY2016_START, UK_FY2016_END),
+}
+QUARTER_BOUNDS = {
+    US_FEDERAL: [
+        (US_FY2017_START, US_FY2017_Q1_END),
+        (
+            datetime.datetime(2017, 1, 1, 0, 0, 0),
+            datetime.datetime(2017, 3, 31, 23, 59, 59),
+        ),
+        (
+            datetime.datetime(2017, 4, 1, 0, 0, 0),
+            datetime.datetime(2017, 6, 30, 23, 59, 59),
+        ),
+        (
+            datetime.datetime(2017, 7, 1, 0, 0, 0),
+            datetime.datetime(2017, 9, 30, 23, 59, 59),
+        ),
+    ],
+    UK_PERSONAL: [
+        (UK_FY2017_START, UK_FY2017_Q1_END),
+        (
+            datetime.datetime(2017, 7, 6, 0, 0, 0),
+            datetime.datetime(2017, 10, 5, 23, 59, 59),
+        ),
+        (
+            datetime.datetime(2017, 10, 6, 0, 0, 0),
+            datetime.datetime(2018, 1, 5, 23, 59, 59),
+        ),
+        (
+            datetime.datetime(2018, 1, 6, 0, 0, 0),
+            datetime.datetime(2018, 4, 5, 23, 59, 59),
+        ),
+    ],
+}
+# Expected (fiscal_year, fiscal_month) of 2017-01-01 and 2017-11-15 in each calendar
+DATE_FISCAL_MONTHS = {
+    US_FEDERAL: ((2017, 4), (2018, 2)),
+    UK_PERSONAL: ((2016, 9), (2017, 8)),
+}
+
+
+@pytest.fixture(params=[US_FEDERAL, UK_PERSONAL], ids=["US", "UK"])
+def calendar(request: pytest.FixtureRequest) -> Iterator[Calendar]:
+    with fiscalyear.fiscal_calendar(*request.param):
+        yield request.param
+
+
+def active_calendar() -> Calendar:
+    """Read the fiscal calendar currently set in the public globals."""
+    return (fiscalyear.START_YEAR, fiscalyear.START_MONTH, fiscalyear.START_DAY)
+
+
+# Check that a test both starts and leaves behind the default fiscal calendar,
+# restoring it either way so a failure cannot leak into later tests
+@pytest.fixture
+def default_calendar() -> Iterator[None]:
+    assert active_calendar() == US_FEDERAL
+    yield
+    active = active_calendar()
+    fiscalyear.START_YEAR, fiscalyear.START_MONTH, fiscalyear.START_DAY = US_FEDERAL
+    assert active == US_FEDERAL
+
+
+# Freeze FiscalDate.today() on the first day of FY2017 in the US federal calendar
+@pytest.fixture
+def frozen_today(monkeypatch: MonkeyPatch) -> None:
+    def today() -> FiscalDate:
+        return FiscalDate(2016, 10, 1)
+
+    monkeypatch.setattr(FiscalDate, "today", today)
+
+
+# Fiscal objects are immutable, so each is built once and shared by every test
+@pytest.fixture(scope="session")
+def fy_2015() -> FiscalYear:
+    return FiscalYear(2015)
+
+
+@pytest.fixture(scope="session")
+def fy_2016() -> FiscalYear:
+    return FiscalYear(2016)
+
+
+@pytest.fixture(scope="session")
+def fy_2017() -> FiscalYear:
+    return FiscalYear(2017)
+
+
+@pytest.fixture(scope="session")
+def fq_2016_4() -> FiscalQuarter:
+    return FiscalQuarter(2016, 4)
+
+
+@pytest.fixture(scope="session")
+def fq_2017_1() -> FiscalQuarter:
+    return FiscalQuarter(2017, 1)
+
+
+@pytest.fixture(scope="session")
+def fq_2017_2() -> FiscalQuarter:
+    return FiscalQuarter(2017, 2)
+
+
+@pytest.fixture(scope="session")
+def fq_2017_3() -> FiscalQuarter:
+    return FiscalQuarter(2017, 3)
+
+
+@pytest.fixture(scope="session")
+def fq_2017_4() -> FiscalQuarter:
+    return FiscalQuarter(2017, 4)
+
+
+@pytest.fixture(scope="session")
+def fq_2018_1() -> FiscalQuarter:
+    return FiscalQuarter(2018, 1)
+
+
+# Consecutive fiscal quarters from FY2016 Q4 to FY2018 Q1
+@pytest.fixture(scope="session")
+def quarter_chain(
+    fq_2016_4: FiscalQuarter,
+    fq_2017_1: FiscalQuarter,
+    fq_2017_2: FiscalQuarter,
+    fq_2017_3: FiscalQuarter,
+    fq_2017_4: FiscalQuarter,
+    fq_2018_1: FiscalQuarter,
+) -> tuple[FiscalQuarter, ...]:
+    return (fq_2016_4, fq_2017_1, fq_2017_2, fq_2017_3, fq_2017_4, fq_2018_1)
+
+
+@pytest.fixture(scope="session")
+def fm_2016_1() -> FiscalMonth:
+    return FiscalMonth(2016, 1)
+
+
+@pytest.fixture(scope="session")
+def fm_2016_2() -> FiscalMonth:
+    return FiscalMonth(2016, 2)
+
+
+@pytest.fixture(scope="session")
+def fm_2016_12() -> FiscalMonth:
+    return FiscalMonth(2016, 12)
+
+
+@pytest.fixture(scope="session")
+def fm_2017_1() -> FiscalMonth:
+    return FiscalMonth(2017, 1)
+
+
+@pytest.fixture(scope="session")
+def fd_2016_1() -> FiscalDay:
+    return FiscalDay(2016, 1)
+
+
+@pytest.fixture(scope="session")
+def fd_2016_2() -> FiscalDay:
+    return FiscalDay(2016, 2)
+
+
+@pytest.fixture(scope="session")
+def fd_2016_366() -> FiscalDay:
+    return FiscalDay(2016, 366)
+
+
+@pytest.fixture(scope="session")
+def fd_2017_1() -> FiscalDay:
+    return FiscalDay(2017, 1)
+
+
+@pytest.fixture(scope="session")
+def date_2017_1_1() -> FiscalDate:
+    return FiscalDate(2017, 1, 1)
+
+
+@pytest.fixture(scope="session")
+def date_2017_11_15() -> FiscalDate:
+    return FiscalDate(2017, 11, 15)
+
+
+@pytest.fixture(scope="session")
+def datetime_2017_1_1() -> FiscalDateTime:
+    return FiscalDateTime(2017, 1, 1, 0, 0, 0)
+
+
+@pytest.fixture(scope="session")
+def datetime_2017_11_15() -> FiscalDateTime:
+    return FiscalDateTime(2017, 11, 15, 12, 4, 30)
+
+
+# Inputs for the validation helpers, built once and checked in a loop
+INVALID_YEARS = (-1, 0, 10000)
+VALID_YEARS = (1, 2)
+INVALID_DAYS = ((1, -1), (1, 0), (1, 32), (2, 29), (4, 31))
+VALID_DAYS = ((1, 1), (1, 2), (1, 31), (2, 28), (12, 31))
+INVALID_QUARTERS = (-1, 0, 5)
+VALID_QUARTERS = (1, 2)
+# Each invalid calendar along with the error it is rejected with
+INVALID_CALENDARS = (
+    ("asdf", 12, 1, "'start_year' must be either 'previous' or 'same', not: 'asdf'"),
+    ("same", -1, 1, "month -1 is out of range"),
+    ("same", 0, 1, "month 0 is out of range"),
+    ("same", 13, 1, "month 13 is out of range"),
+    ("same", 12, 0, "day 0 is out of range"),
+    ("same", 12, -1, "day -1 is out of range"),
+    ("same", 12, 32, "day 32 is out of range"),
+)
+VALID_CALENDARS = (
+    ("same", 1, 1),
+    ("same", 1, 31),
+    ("same", 12, 1),
+    ("previous", 1, 1),
+    ("previous", 1, 31),
+    ("previous", 12, 1),
+)
+
+# Expected results of each comparison operator applied to two fiscal periods:
+# (operator, lower op higher, higher op lower, period op itself)
+Comparison = Callable[[Any, Any], bool]
+COMPARISONS = (
+    (operator.lt, True, False, False),
+    (operator.le, True, False, True),
+    (operator.eq, False, False, True),
+    (operator.ne, True, True, False),
+    (operator.gt, False, True, False),
+    (operator.ge, False, True, True),
+)
+
+
+def all_date_types(year: int, month: int, day: int) -> tuple[datetime.date, ...]:
+    """Return midnight on the given day as each supported date and datetime type."""
+    return (
+        FiscalDateTime(year, month, day),
+        datetime.datetime(year, month, day),
+        FiscalDate(year, month, day),
+        datetime.date(year, month, day),
+    )
+
+
+# Dates checked for membership by several tests
+OCT_1_2015 = all_date_types(2015, 10, 1)
+JAN_1_2016 = all_date_types(2016, 1, 1)
+AUG_1_2016 = all_date_types(2016, 8, 1)
 
 
 class TestCheckYear:
-    @pytest.mark.parametrize("value", [-1, 0, 10000])
-    def test_invalid_input(self, value: int) -> None:
-        with pytest.raises(ValueError):
-            fiscalyear._check_year(value)
+    def test_invalid_input(self) -> None:
+        for value in INVALID_YEARS:
+            with pytest.raises(ValueError, match=f"year {value} is out of range"):
+                fiscalyear._check_year(value)
 
-    @pytest.mark.parametrize("value", [1, 2])
-    def test_valid_input(self, value: int) -> None:
-        assert int(value) == fiscalyear._check_year(value)
+    def test_valid_input(self) -> None:
+        for value in VALID_YEARS:
+            assert int(value) == fiscalyear._check_year(value)
 
 
 class TestCheckDay:
-    @pytest.mark.parametrize("month, day", [(1, -1), (1, 0), (1, 32), (1, 32)])
-    def test_invalid_input(self, month: int, day: int) -> None:
-        with pytest.raises(ValueError):
-            fiscalyear._check_day(month, day)
+    def test_invalid_input(self) -> None:
+        for month, day in INVALID_DAYS:
+            with pytest.raises(ValueError, match=f"day {day} is out of range"):
+                fiscalyear._check_day(month, day)
 
-    @pytest.mark.parametrize("month, day", [(1, 1), (1, 2), (1, 31)])
-    def test_valid_input(self, month: int, day: int) -> None:
-        assert int(day) == fiscalyear._check_day(month, day)
+    def test_valid_input(self) -> None:
+        for month, day in VALID_DAYS:
+            assert int(day) == fiscalyear._check_day(month, day)
 
 
 class TestCheckQuarter:
-    @pytest.mark.parametrize("value", [-1, 0, 5])
-    def test_invalid_input(self, value: int) -> None:
-        with pytest.raises(ValueError):
-            fiscalyear._check_quarter(value)
+    def test_invalid_input(self) -> None:
+        for value in INVALID_QUARTERS:
+            with pytest.raises(ValueError, match=f"quarter {value} is out of range"):
+                fiscalyear._check_quarter(value)
 
-    @pytest.mark.parametrize("value", [1, 2])
-    def test_valid_input(self, value: int) -> None:
-        assert int(value) == fiscalyear._check_quarter(value)
+    def test_valid_input(self) -> None:
+        for value in VALID_QUARTERS:
+            assert int(value) == fiscalyear._check_quarter(value)
 
 
 class TestValidateFiscalCalendarParams:
-    @pytest.mark.parametrize(
-        "start_year, start_month, start_day",
-        [
-            ("asdf", 12, 1),
-            ("same", -1, 1),
-            ("same", 0, 1),
-            ("same", 13, 1),
-            ("same", 12, 0),
-            ("same", 12, -1),
-            ("same", 12, 32),
-        ],
-    )
-    def test_invalid_input(
-        self, start_year: str, start_month: int, start_day: int
-    ) -> None:
-        with pytest.raises(ValueError):
+    def test_invalid_input(self) -> None:
+        for start_year, start_month, start_day, message in INVALID_CALENDARS:
+            with pytest.raises(ValueError, match=message):
+                fiscalyear._validate_fiscal_calendar_params(
+                    start_year, start_month, start_day
+                )
+
+    def test_valid_input(self) -> None:
+        for start_year, start_month, start_day in VALID_CALENDARS:
             fiscalyear._validate_fiscal_calendar_params(
                 start_year, start_month, start_day
             )
 
+
+class TestMonthTable:
+    def test_invalid_input(self) -> None:
+        with pytest.raises(ValueError):
+            fiscalyear._month_table("asdf", 10)
+
     @pytest.mark.parametrize(
-        "start_year, start_month, start_day",
+        "start_year, start_month, first, last",
         [
-            ("same", 1, 1),
-            ("same", 1, 31),
-            ("same", 12, 1),
-            ("previous", 1, 1),
-            ("previous", 1, 31),
-            ("previous", 12, 1),
+            ("previous", 10, (-1, 10), (0, 9)),
+            ("previous", 1, (-1, 1), (-1, 12)),
+            ("same", 4, (0, 4), (1, 3)),
+            ("same", 1, (0, 1), (0, 12)),
         ],
     )
     def test_valid_input(
-        self, start_year: str, start_month: int, start_day: int
+        self,
+        start_year: str,
+        start_month: int,
+        first: tuple[int, int],
+        last: tuple[int, int],
     ) -> None:
-        fiscalyear._validate_fiscal_calendar_params(start_year, start_month, start_day)
+        table = fiscalyear._month_table(start_year, start_month)
+        assert len(table) == 12
+        assert table[0] == first
+        assert table[-1] == last
 
 
+@pytest.mark.usefixtures("default_calendar")
 class TestSetupFiscalCalendar:
     def test_start_year(self) -> None:
-        assert fiscalyear.START_YEAR == "previous"
-
         fiscalyear.setup_fiscal_calendar(start_year="same")
         assert fiscalyear.START_YEAR == "same"
         fiscalyear.setup_fiscal_calendar(start_year="previous")
 
-        assert fiscalyear.START_YEAR == "previous"
-
     def test_start_month(self) -> None:
-        assert fiscalyear.START_MONTH == 10
-
         fiscalyear.setup_fiscal_calendar(start_month=4)
         assert fiscalyear.START_MONTH == 4
         fiscalyear.setup_fiscal_calendar(start_month=10)
 
-        assert fiscalyear.START_MONTH == 10
-
     def test_start_day(self) -> None:
-        assert fiscalyear.START_DAY == 1
-
         fiscalyear.setup_fiscal_calendar(start_day=6)
         assert fiscalyear.START_DAY == 6
         fiscalyear.setup_fiscal_calendar(start_day=1)
 
-        assert fiscalyear.START_DAY == 1
-
     def test_complex(self) -> None:
         # Test defaults
         day = FiscalDate(2017, 12, 1)
@@ -133,668 +389,596 @@ class TestSetupFiscalCalendar:
         assert day.fiscal_year == 2018
         assert day.fiscal_quarter == 1
 
+    def test_cached_values(self) -> None:
+        day = FiscalDate(2017, 5, 1)
+        year = FiscalYear(2017)
+        assert day.fiscal_year == 2017
+        assert day.fiscal_day == 213
+        assert year.start == US_FY2017_START
 
-class TestFiscalCalendar:
-    def test_start_year(self) -> None:
-        assert fiscalyear.START_YEAR == "previous"
-
-        with fiscalyear.fiscal_calendar(start_year="same"):
-            assert fiscalyear.START_YEAR == "same"
-
-        assert fiscalyear.START_YEAR == "previous"
-
-    def test_start_month(self) -> None:
-        assert fiscalyear.START_MONTH == 10
-
-        with fiscalyear.fiscal_calendar(start_month=4):
-            assert fiscalyear.START_MONTH == 4
-
-        assert fiscalyear.START_MONTH == 10
-
-    def test_start_day(self) -> None:
-        assert fiscalyear.START_DAY == 1
-
-        with fiscalyear.fiscal_calendar(start_day=6):
-            assert fiscalyear.START_DAY == 6
-
-        assert fiscalyear.START_DAY == 1
+        # Values cached under the old calendar must not leak into the new one
+        fiscalyear.setup_fiscal_calendar(start_month=4)
+        assert day.fiscal_year == 2018
+        assert day.fiscal_day == 31
+        assert FiscalDate(2017, 5, 1).fiscal_year == 2018
+        assert year.start == datetime.datetime(2016, 4, 1, 0, 0, 0)
+        fiscalyear.setup_fiscal_calendar(start_month=10)
 
-    def test_complex(self) -> None:
-        assert fiscalyear.START_YEAR == "previous"
-        assert fiscalyear.START_MONTH == 10
-        assert fiscalyear.START_DAY == 1
+        assert day.fiscal_year == 2017
+        assert year.start == US_FY2017_START
 
-        with fiscalyear.fiscal_calendar("same", 4, 6):
-            assert fiscalyear.START_YEAR == "same"
-            assert fiscalyear.START_MONTH == 4
-            assert fiscalyear.START_DAY == 6
 
-        assert fiscalyear.START_YEAR == "previous"
-        assert fiscalyear.START_MONTH == 10
-        assert fiscalyear.START_DAY == 1
+@pytest.mark.usefixtures("default_calendar")
+class TestFiscalCalendar:
+    # Omitted parameters keep their currently active values
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"start_year": "same"}, ("same", 10, 1)),
+            ({"start_month": 4}, ("previous", 4, 1)),
+            ({"start_day": 6}, ("previous", 10, 6)),
+            ({"start_year": "same", "start_month": 4, "start_day": 6}, UK_PERSONAL),
+        ],
+        ids=["start_year", "start_month", "start_day", "complex"],
+    )
+    def test_override(self, kwargs: dict[str, Any], expected: Calendar) -> None:
+        with fiscalyear.fiscal_calendar(**kwargs):
+            assert active_calendar() == expected
 
     def test_nested(self) -> None:
-        assert fiscalyear.START_YEAR == "previous"
-        assert fiscalyear.START_MONTH == 10
-        assert fiscalyear.START_DAY == 1
-
+        # Each layer overrides one parameter and inherits the rest
         with fiscalyear.fiscal_calendar(start_year="same"):
-            assert fiscalyear.START_YEAR == "same"
-            assert fiscalyear.START_MONTH == 10
-            assert fiscalyear.START_DAY == 1
+            assert active_calendar() == ("same", 10, 1)
 
             with fiscalyear.fiscal_calendar(start_month=4):
-                assert fiscalyear.START_YEAR == "same"
-                assert fiscalyear.START_MONTH == 4
-                assert fiscalyear.START_DAY == 1
+                assert active_calendar() == ("same", 4, 1)
 
                 with fiscalyear.fiscal_calendar(start_day=6):
-                    assert fiscalyear.START_YEAR == "same"
-                    assert fiscalyear.START_MONTH == 4
-                    assert fiscalyear.START_DAY == 6
+                    assert active_calendar() == ("same", 4, 6)
 
-                assert fiscalyear.START_YEAR == "same"
-                assert fiscalyear.START_MONTH == 4
-                assert fiscalyear.START_DAY == 1
+                assert active_calendar() == ("same", 4, 1)
 
-            assert fiscalyear.START_YEAR == "same"
-            assert fiscalyear.START_MONTH == 10
-            assert fiscalyear.START_DAY == 1
+            assert active_calendar() == ("same", 10, 1)
 
-        assert fiscalyear.START_YEAR == "previous"
-        assert fiscalyear.START_MONTH == 10
-        assert fiscalyear.START_DAY == 1
+    def test_exception(self) -> None:
+        with pytest.raises(RuntimeError):
+            with fiscalyear.fiscal_calendar(*UK_PERSONAL):
+                raise RuntimeError
 
-    def test_out_of_range(self) -> None:
-        with pytest.raises(ValueError):
-            with fiscalyear.fiscal_calendar(start_month=0):
-                pass
+        # The calendar is restored even though the body raised
+        assert active_calendar() == US_FEDERAL
 
-        with pytest.raises(ValueError):
-            with fiscalyear.fiscal_calendar(start_month=2, start_day=29):
-                pass
-
-    def test_corner_cases(self) -> None:
-        # start_day does not exist in all months
-        with fiscalyear.fiscal_calendar(start_month=5, start_day=31):
+    def test_out_of_range(self) -> None:
+        for start_month, start_day in ((0, 1), (2, 29)):
+            with pytest.raises(ValueError):
+                with fiscalyear.fiscal_calendar(
+                    start_month=start_month, start_day=start_day
+                ):
+                    pass
+
+    # start_day does not exist in all months
+    @pytest.mark.parametrize(
+        "year, quarter, start_day, end_day",
+        [
             # Non-leap year
-            assert FiscalQuarter(2019, 1).start.day == 31
-            assert FiscalQuarter(2019, 1).end.day == 30
-
-            assert FiscalQuarter(2019, 2).start.day == 31
-            assert FiscalQuarter(2019, 2).end.day == 29
-
-            assert FiscalQuarter(2019, 3).start.day == 30
-            assert FiscalQuarter(2019, 3).end.day == 27
-
-            assert FiscalQuarter(2019, 4).start.day == 28
-            assert FiscalQuarter(2019, 4).end.day == 30
-
+            (2019, 1, 31, 30),
+            (2019, 2, 31, 29),
+            (2019, 3, 30, 27),
+            (2019, 4, 28, 30),
             # Leap year
-            assert FiscalQuarter(2020, 1).start.day == 31
-            assert FiscalQuarter(2020, 1).end.day == 30
-
-            assert FiscalQuarter(2020, 2).start.day == 31
-            assert FiscalQuarter(2020, 2).end.day == 29
-
-            assert FiscalQuarter(2020, 3).start.day == 30
-            assert FiscalQuarter(2020, 3).end.day == 28
+            (2020, 1, 31, 30),
+            (2020, 2, 31, 29),
+            (2020, 3, 30, 28),
+            (2020, 4, 29, 30),
+        ],
+    )
+    def test_corner_cases(
+        self, year: int, quarter: int, start_day: int, end_day: int
+    ) -> None:
+        with fiscalyear.fiscal_calendar(start_month=5, start_day=31):
+            fiscal_quarter = FiscalQuarter(year, quarter)
+            assert fiscal_quarter.start.day == start_day
+            assert fiscal_quarter.end.day == end_day
 
-            assert FiscalQuarter(2020, 4).start.day == 29
-            assert FiscalQuarter(2020, 4).end.day == 30
+    def test_corner_cases_months(self) -> None:
+        # Months are clamped the same way as quarters
+        with fiscalyear.fiscal_calendar(start_month=5, start_day=31):
+            assert FiscalMonth(2019, 2).start.day == 30
+            assert FiscalMonth(2019, 2).end.day == 30
+            assert FiscalMonth(2020, 10).start.day == 29
 
 
 class TestFiscalYear:
-    @pytest.fixture(scope="class")
-    def a(self) -> FiscalYear:
-        return FiscalYear(2016)
-
-    @pytest.fixture(scope="class")
-    def b(self) -> FiscalYear:
-        return FiscalYear(2017)
-
-    @pytest.fixture(scope="class")
-    def c(self) -> FiscalQuarter:
-        return FiscalQuarter(2017, 2)
-
-    @pytest.fixture(scope="class")
-    def d(self) -> FiscalMonth:
-        return FiscalMonth(2017, 1)
-
-    @pytest.fixture(scope="class")
-    def e(self) -> FiscalYear:
-        return FiscalYear(2015)
-
-    def test_basic(self, a: FiscalYear) -> None:
-        assert a.fiscal_year == 2016
+    def test_basic(self, fy_2016: FiscalYear) -> None:
+        assert fy_2016.fiscal_year == 2016
 
-    def test_current(self, monkeypatch: MonkeyPatch) -> None:
-        def today() -> FiscalDate:
-            return FiscalDate(2016, 10, 1)
-
-        monkeypatch.setattr(FiscalDate, "today", today)
+    @pytest.mark.usefixtures("frozen_today")
+    def test_current(self) -> None:
         current = FiscalYear.current()
         assert current == FiscalYear(2017)
 
-    def test_repr(self, a: FiscalYear) -> None:
-        assert repr(a) == "FiscalYear(2016)"
+    def test_repr(self, fy_2016: FiscalYear) -> None:
+        assert repr(fy_2016) == "FiscalYear(2016)"
 
-    def test_str(self, a: FiscalYear) -> None:
-        assert str(a) == "FY2016"
+    def test_str(self, fy_2016: FiscalYear) -> None:
+        assert str(fy_2016) == "FY2016"
 
     def test_out_of_range(self) -> None:
-        with pytest.raises(ValueError):
-            FiscalYear(0)
+        for year in (0, -2017):
+            with pytest.raises(ValueError):
+                FiscalYear(year)
 
-        with pytest.raises(ValueError):
-            FiscalYear(-2017)
+    def test_prev_fiscal_year(self, fy_2016: FiscalYear, fy_2017: FiscalYear) -> None:
+        assert fy_2016 == fy_2017.prev_fiscal_year
 
-    def test_prev_fiscal_year(self, a: FiscalYear, b: FiscalYear) -> None:
-        assert a == b.prev_fiscal_year
+    def test_next_fiscal_year(self, fy_2016: FiscalYear, fy_2017: FiscalYear) -> None:
+        assert fy_2016.next_fiscal_year == fy_2017
 
-    def test_next_fiscal_year(self, a: FiscalYear, b: FiscalYear) -> None:
-        assert a.next_fiscal_year == b
+    def test_start(self, calendar: Calendar, fy_2016: FiscalYear) -> None:
+        assert fy_2016.start == fy_2016.q1.start
+        assert fy_2016.start == YEAR_BOUNDS[calendar][0]
 
-    def test_start(self, a: FiscalYear) -> None:
-        assert a.start == a.q1.start
+    def test_end(self, calendar: Calendar, fy_2016: FiscalYear) -> None:
+        assert fy_2016.end == fy_2016.q4.end
+        assert fy_2016.end == YEAR_BOUNDS[calendar][1]
 
-        with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert a.start == datetime.datetime(2015, 10, 1, 0, 0, 0)
+    def test_cache(self, fy_2016: FiscalYear) -> None:
+        start, end, hash_ = fy_2016.start, fy_2016.end, hash(fy_2016)
+        assert fy_2016.start is start
+        assert fy_2016.end is end
 
         with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert a.start == datetime.datetime(2016, 4, 6, 0, 0, 0)
+            assert fy_2016.start == UK_FY2016_START
+            assert fy_2016.end == UK_FY2016_END
 
-    def test_end(self, a: FiscalYear) -> None:
-        assert a.end == a.q4.end
-
-        with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert a.end == datetime.datetime(2016, 9, 30, 23, 59, 59)
-
-        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert a.end == datetime.datetime(2017, 4, 5, 23, 59, 59)
+        assert fy_2016.start == start
+        assert fy_2016.end == end
+        assert hash(fy_2016) == hash_
 
-    def test_q1(self, a: FiscalYear) -> None:
-        assert a.q1 == FiscalQuarter(2016, 1)
+    def test_q1(self, fy_2016: FiscalYear) -> None:
+        assert fy_2016.q1 == FiscalQuarter(2016, 1)
 
-    def test_q2(self, a: FiscalYear) -> None:
-        assert a.q2 == FiscalQuarter(2016, 2)
+    def test_q2(self, fy_2016: FiscalYear) -> None:
+        assert fy_2016.q2 == FiscalQuarter(2016, 2)
 
-    def test_q3(self, a: FiscalYear) -> None:
-        assert a.q3 == FiscalQuarter(2016, 3)
+    def test_q3(self, fy_2016: FiscalYear) -> None:
+        assert fy_2016.q3 == FiscalQuarter(2016, 3)
 
-    def test_q4(self, a: FiscalYear) -> None:
-        assert a.q4 == FiscalQuarter(2016, 4)
+    def test_q4(self, fy_2016: FiscalYear) -> None:
+        assert fy_2016.q4 == FiscalQuarter(2016, 4)
 
-    def test_is_leap(self, a: FiscalYear, b: FiscalYear, e: FiscalYear) -> None:
+    def test_is_leap(
+        self, fy_2016: FiscalYear, fy_2017: FiscalYear, fy_2015: FiscalYear
+    ) -> None:
         # default US start_year='previous', start_month=10
-        assert isinstance(a.isleap, bool)
-        assert isinstance(e.isleap, bool)
+        assert isinstance(fy_2016.isleap, bool)
+        assert isinstance(fy_2015.isleap, bool)
 
         with fiscalyear.fiscal_calendar(start_year="previous", start_month=1):
-            assert not a.isleap
-            assert b.isleap
+            assert not fy_2016.isleap
+            assert fy_2017.isleap
 
         with fiscalyear.fiscal_calendar(start_year="same", start_month=3):
-            assert not a.isleap
-            assert e.isleap
+            assert not fy_2016.isleap
+            assert fy_2015.isleap
 
         with fiscalyear.fiscal_calendar(start_year="same", start_month=1):
-            assert a.isleap
-            assert not e.isleap
+            assert fy_2016.isleap
+            assert not fy_2015.isleap
 
     def test_contains(
-        self, a: FiscalYear, b: FiscalYear, c: FiscalYear, d: FiscalYear
+        self,
+        fy_2016: FiscalYear,
+        fy_2017: FiscalYear,
+        fq_2017_2: FiscalQuarter,
+        fm_2017_1: FiscalMonth,
     ) -> None:
-        assert b in b
-        assert c not in a
-        assert c in b
-        assert d in b
-
-        assert FiscalDateTime(2016, 1, 1, 0, 0, 0) in a
-        assert datetime.datetime(2016, 1, 1, 0, 0, 0) in a
-        assert FiscalDate(2016, 1, 1) in a
-        assert datetime.date(2016, 1, 1) in a
-
-    def test_less_than(self, a: FiscalYear, b: FiscalYear) -> None:
-        assert a < b
-
-    def test_less_than_equals(self, a: FiscalYear, b: FiscalYear) -> None:
-        assert a <= b <= b
+        assert fy_2017 in fy_2017
+        assert fq_2017_2 not in fy_2016
+        assert fq_2017_2 in fy_2017
+        assert fm_2017_1 in fy_2017
 
-    def test_equals(self, b: FiscalYear) -> None:
-        assert b == b
+        for date in JAN_1_2016:
+            assert date in fy_2016
 
-        with pytest.raises(TypeError):
-            b == 1
-
-    def test_not_equals(self, a: FiscalYear, b: FiscalYear) -> None:
-        assert a != b
+    @pytest.mark.parametrize("op, lower_higher, higher_lower, same", COMPARISONS)
+    def test_comparison(
+        self,
+        fy_2016: FiscalYear,
+        fy_2017: FiscalYear,
+        op: Comparison,
+        lower_higher: bool,
+        higher_lower: bool,
+        same: bool,
+    ) -> None:
+        assert op(fy_2016, fy_2017) == lower_higher
+        assert op(fy_2017, fy_2016) == higher_lower
+        assert op(fy_2017, fy_2017) == same
 
+    @pytest.mark.parametrize("op", [operator.eq, operator.ne])
+    def test_comparison_wrong_type(self, fy_2017: FiscalYear, op: Comparison) -> None:
         with pytest.raises(TypeError):
-            a != 1
+            op(fy_2017, 1)
 
-    def test_greater_than(self, a: FiscalYear, b: FiscalYear) -> None:
-        assert b > a
-
-    def test_greater_than_equals(self, a: FiscalYear, b: FiscalYear) -> None:
-        assert b >= b >= a
+    def test_hash(
+        self, fy_2016: FiscalYear, fy_2017: FiscalYear, fy_2015: FiscalYear
+    ) -> None:
+        assert hash(fy_2016) == hash(fy_2016)
+        assert len({hash(fy_2016), hash(fy_2017), hash(fy_2015)}) == 3
 
-    def test_hash(self, a: FiscalYear, b: FiscalYear, e: FiscalYear) -> None:
-        assert hash(a) == hash(a)
-        assert hash(a) != hash(b) != hash(e)
+    def test_hash_with_ints(self, fy_2016: FiscalYear) -> None:
+        # Fiscal years can share a set or dict with the plain int year
+        assert len({2016, fy_2016}) == 2
+        assert {2016: "int", fy_2016: "year"}[fy_2016] == "year"
 
 
 class TestFiscalQuarter:
-    @pytest.fixture(scope="class")
-    def a(self) -> FiscalQuarter:
-        return FiscalQuarter(2016, 4)
-
-    @pytest.fixture(scope="class")
-    def b(self) -> FiscalQuarter:
-        return FiscalQuarter(2017, 1)
-
-    @pytest.fixture(scope="class")
-    def c(self) -> FiscalQuarter:
-        return FiscalQuarter(2017, 2)
-
-    @pytest.fixture(scope="class")
-    def d(self) -> FiscalQuarter:
-        return FiscalQuarter(2017, 3)
-
-    @pytest.fixture(scope="class")
-    def e(self) -> FiscalQuarter:
-        return FiscalQuarter(2017, 4)
-
-    @pytest.fixture(scope="class")
-    def f(self) -> FiscalQuarter:
-        return FiscalQuarter(2018, 1)
-
-    def test_basic(self, a: FiscalQuarter) -> None:
-        assert a.fiscal_year == 2016
-        assert a.fiscal_quarter == 4
-
-    def test_current(self, monkeypatch: MonkeyPatch) -> None:
-        def today() -> FiscalDate:
-            return FiscalDate(2016, 10, 1)
+    def test_basic(self, fq_2016_4: FiscalQuarter) -> None:
+        assert fq_2016_4.fiscal_year == 2016
+        assert fq_2016_4.fiscal_quarter == 4
 
-        monkeypatch.setattr(FiscalDate, "today", today)
+    @pytest.mark.usefixtures("frozen_today")
+    def test_current(self) -> None:
         current = FiscalQuarter.current()
         assert current == FiscalQuarter(2017, 1)
 
-    def test_repr(self, a: FiscalQuarter) -> None:
-        assert repr(a) == "FiscalQuarter(2016, 4)"
+    def test_repr(self, fq_2016_4: FiscalQuarter) -> None:
+        assert repr(fq_2016_4) == "FiscalQuarter(2016, 4)"
 
-    def test_str(self, a: FiscalQuarter) -> None:
-        assert str(a) == "FY2016 Q4"
+    def test_str(self, fq_2016_4: FiscalQuarter) -> None:
+        assert str(fq_2016_4) == "FY2016 Q4"
 
     def test_out_of_range(self) -> None:
-        with pytest.raises(ValueError):
-            FiscalQuarter(2017, 0)
-
-        with pytest.raises(ValueError):
-            FiscalQuarter(2017, 5)
-
-        with pytest.raises(ValueError):
-            FiscalQuarter(0, 2)
+        for year, quarter in ((2017, 0), (2017, 5), (0, 2)):
+            with pytest.raises(ValueError):
+                FiscalQuarter(year, quarter)
 
     def test_prev_fiscal_quarter(
-        self,
-        a: FiscalQuarter,
-        b: FiscalQuarter,
-        c: FiscalQuarter,
-        d: FiscalQuarter,
-        e: FiscalQuarter,
-        f: FiscalQuarter,
-    ) -> None:
-        assert a == b.prev_fiscal_quarter
-        assert b == c.prev_fiscal_quarter
-        assert c == d.prev_fiscal_quarter
-        assert d == e.prev_fiscal_quarter
-        assert e == f.prev_fiscal_quarter
+        self, quarter_chain: tuple[FiscalQuarter, ...]
+    ) -> None:
+        for prev, quarter in zip(quarter_chain, quarter_chain[1:]):
+            assert quarter.prev_fiscal_quarter == prev
 
     def test_next_fiscal_quarter(
-        self,
-        a: FiscalQuarter,
-        b: FiscalQuarter,
-        c: FiscalQuarter,
-        d: FiscalQuarter,
-        e: FiscalQuarter,
-        f: FiscalQuarter,
-    ) -> None:
-        assert a.next_fiscal_quarter == b
-        assert b.next_fiscal_quarter == c
-        assert c.next_fiscal_quarter == d
-        assert d.next_fiscal_quarter == e
-        assert e.next_fiscal_quarter == f
-
-    def test_start(self, a: FiscalQuarter) -> None:
+        self, quarter_chain: tuple[FiscalQuarter, ...]
+    ) -> None:
+        for quarter, next_ in zip(quarter_chain, quarter_chain[1:]):
+            assert quarter.next_fiscal_quarter == next_
+
+    def test_start(self, fq_2016_4: FiscalQuarter) -> None:
         with fiscalyear.fiscal_calendar(start_month=3):
-            assert a.start == datetime.datetime(2015, 12, 1, 0, 0)
+            assert fq_2016_4.start == datetime.datetime(2015, 12, 1, 0, 0)
 
-    def test_end(self, a: FiscalQuarter) -> None:
+    def test_end(self, fq_2016_4: FiscalQuarter) -> None:
         with fiscalyear.fiscal_calendar(start_month=1, start_year="same"):
-            assert a.end == datetime.datetime(2016, 12, 31, 23, 59, 59)
-
-    def test_bad_start_year(self, a: FiscalQuarter) -> None:
-        backup_start_year = fiscalyear.START_YEAR
-        fiscalyear.START_YEAR = "hello world"
-
-        with pytest.raises(ValueError):
-            a.start
+            assert fq_2016_4.end == US_FY2017_Q1_END
 
-        fiscalyear.START_YEAR = backup_start_year
-
-    def test_q1_start(self, b: FiscalQuarter) -> None:
-        with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert b.start == datetime.datetime(2016, 10, 1, 0, 0, 0)
+    def test_cache(self, fq_2017_1: FiscalQuarter) -> None:
+        start, end, hash_ = fq_2017_1.start, fq_2017_1.end, hash(fq_2017_1)
+        assert isinstance(end, FiscalDateTime)
+        assert fq_2017_1.start is start
+        assert fq_2017_1.end is end
 
         with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert b.start == datetime.datetime(2017, 4, 6, 0, 0, 0)
+            assert fq_2017_1.start == UK_FY2017_START
+            assert fq_2017_1.end == UK_FY2017_Q1_END
 
-    def test_q1_end(self, b: FiscalQuarter) -> None:
-        with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert b.end == datetime.datetime(2016, 12, 31, 23, 59, 59)
+        assert fq_2017_1.start == start
+        assert fq_2017_1.end == end
+        assert hash(fq_2017_1) == hash_
 
-        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert b.end == datetime.datetime(2017, 7, 5, 23, 59, 59)
-
-    def test_q2_start(self, c: FiscalQuarter) -> None:
-        with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert c.start == datetime.datetime(2017, 1, 1, 0, 0, 0)
-
-        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert c.start == datetime.datetime(2017, 7, 6, 0, 0, 0)
-
-    def test_q2_end(self, c: FiscalQuarter) -> None:
-        with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert c.end == datetime.datetime(2017, 3, 31, 23, 59, 59)
-
-        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert c.end == datetime.datetime(2017, 10, 5, 23, 59, 59)
-
-    def test_q3_start(self, d: FiscalQuarter) -> None:
-        with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert d.start == datetime.datetime(2017, 4, 1, 0, 0, 0)
-
-        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert d.start == datetime.datetime(2017, 10, 6, 0, 0, 0)
-
-    def test_q3_end(self, d: FiscalQuarter) -> None:
-        with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert d.end == datetime.datetime(2017, 6, 30, 23, 59, 59)
-
-        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert d.end == datetime.datetime(2018, 1, 5, 23, 59, 59)
-
-    def test_q4_start(self, e: FiscalQuarter) -> None:
-        with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert e.start == datetime.datetime(2017, 7, 1, 0, 0, 0)
+    def test_bad_start_year(
+        self, fq_2016_4: FiscalQuarter, monkeypatch: MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(fiscalyear, "START_YEAR", "hello world")
 
-        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert e.start == datetime.datetime(2018, 1, 6, 0, 0, 0)
+        with pytest.raises(ValueError):
+            fq_2016_4.start
 
-    def test_q4_end(self, e: FiscalQuarter) -> None:
-        with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert e.end == datetime.datetime(2017, 9, 30, 23, 59, 59)
+    @pytest.mark.parametrize("quarter", [1, 2, 3, 4])
+    def test_quarter_bounds(self, calendar: Calendar, quarter: int) -> None:
+        start, end = QUARTER_BOUNDS[calendar][quarter - 1]
+        fiscal_quarter = FiscalQuarter(2017, quarter)
+        assert fiscal_quarter.start == start
+        assert fiscal_quarter.end == end
 
-        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert e.end == datetime.datetime(2018, 4, 5, 23, 59, 59)
+    def test_contains(self, fq_2016_4: FiscalQuarter, fq_2018_1: FiscalQuarter) -> None:
+        assert fq_2016_4 not in fq_2018_1
+        assert fq_2018_1 in fq_2018_1
 
-    def test_contains(self, a: FiscalQuarter, f: FiscalQuarter) -> None:
-        assert a not in f
-        assert f in f
+        assert FiscalMonth(2016, 10) in fq_2016_4
+        assert FiscalMonth(2016, 12) in fq_2016_4
+        assert FiscalMonth(2016, 9) not in fq_2016_4
+        assert FiscalMonth(2017, 10) not in fq_2016_4
 
-        assert FiscalDateTime(2016, 8, 1, 0, 0, 0) in a
-        assert datetime.datetime(2016, 8, 1, 0, 0, 0) in a
-        assert FiscalDate(2016, 8, 1) in a
-        assert datetime.date(2016, 8, 1) in a
+        for date in AUG_1_2016:
+            assert date in fq_2016_4
 
-    def test_less_than(
+    @pytest.mark.parametrize("op, lower_higher, higher_lower, same", COMPARISONS)
+    def test_comparison(
         self,
-        a: FiscalQuarter,
-        b: FiscalQuarter,
-        c: FiscalQuarter,
-        d: FiscalQuarter,
-        e: FiscalQuarter,
-        f: FiscalQuarter,
+        fq_2017_1: FiscalQuarter,
+        fq_2017_2: FiscalQuarter,
+        op: Comparison,
+        lower_higher: bool,
+        higher_lower: bool,
+        same: bool,
     ) -> None:
-        assert a < b < c < d < e < f
+        assert op(fq_2017_1, fq_2017_2) == lower_higher
+        assert op(fq_2017_2, fq_2017_1) == higher_lower
+        assert op(fq_2017_2, fq_2017_2) == same
 
-    def test_less_than_equals(
-        self,
-        a: FiscalQuarter,
-        b: FiscalQuarter,
-        c: FiscalQuarter,
-        d: FiscalQuarter,
-        e: FiscalQuarter,
-        f: FiscalQuarter,
+    @pytest.mark.parametrize("op", [operator.eq, operator.ne])
+    def test_comparison_wrong_type(
+        self, fq_2017_2: FiscalQuarter, op: Comparison
     ) -> None:
-        assert a <= b <= c <= d <= e <= f
-
-    def test_equals(self, f: FiscalQuarter) -> None:
-        assert f == f
-
         with pytest.raises(TypeError):
-            f == 1
+            op(fq_2017_2, 1)
 
-    def test_not_equals(
-        self, b: FiscalQuarter, c: FiscalQuarter, f: FiscalQuarter
+    def test_sort(
+        self,
+        quarter_chain: tuple[FiscalQuarter, ...],
+        fq_2017_1: FiscalQuarter,
+        fq_2018_1: FiscalQuarter,
     ) -> None:
-        # Same year, different quarter
-        assert b != c
+        assert sorted(reversed(quarter_chain)) == list(quarter_chain)
 
         # Same quarter, different year
-        assert b != f
-
-        with pytest.raises(TypeError):
-            b != 1
-
-    def test_greater_than(
-        self,
-        a: FiscalQuarter,
-        b: FiscalQuarter,
-        c: FiscalQuarter,
-        d: FiscalQuarter,
-        e: FiscalQuarter,
-        f: FiscalQuarter,
-    ) -> None:
-        assert f > e > d > c > b > a
+        assert fq_2017_1 != fq_2018_1
 
-    def test_greater_than_equals(
+    def test_hash(
         self,
-        a: FiscalQuarter,
-        b: FiscalQuarter,
-        c: FiscalQuarter,
-        d: FiscalQuarter,
-        e: FiscalQuarter,
-        f: FiscalQuarter,
+        fq_2016_4: FiscalQuarter,
+        fq_2017_1: FiscalQuarter,
+        fq_2017_2: FiscalQuarter,
     ) -> None:
-        assert f >= e >= d >= c >= b >= a
+        assert hash(fq_2016_4) == hash(fq_2016_4)
+        assert len({hash(fq_2016_4), hash(fq_2017_1), hash(fq_2017_2)}) == 3
 
-    def test_hash(self, a: FiscalQuarter, b: FiscalQuarter, c: FiscalQuarter) -> None:
-        assert hash(a) == hash(a)
-        assert hash(a) != hash(b) != hash(c)
+    def test_hash_with_ints(self, fq_2017_1: FiscalQuarter) -> None:
+        # Periods can share a set or dict with the int their sort key packs to
+        packed = fq_2017_1._sort_key
+        assert len({packed, fq_2017_1}) == 2
+        assert {packed: "int", fq_2017_1: "period"}[fq_2017_1] == "period"
 
+    def test_hash_consistency(self) -> None:
+        pairs = list(itertools.product(range(2012, 2023), range(1, 5)))
+        quarters = [FiscalQuarter(*pair) for pair in pairs]
 
-class TestFiscalMonth:
-    @pytest.fixture(scope="class")
-    def a(self) -> FiscalMonth:
-        return FiscalMonth(2016, 1)
-
-    @pytest.fixture(scope="class")
-    def b(self) -> FiscalMonth:
-        return FiscalMonth(2016, 2)
+        for (x, x_pair), (y, y_pair) in itertools.product(
+            zip(quarters, pairs), repeat=2
+        ):
+            assert (x == y) == (x_pair == y_pair)
+            assert (hash(x) == hash(y)) == (x_pair == y_pair)
 
-    @pytest.fixture(scope="class")
-    def c(self) -> FiscalMonth:
-        return FiscalMonth(2016, 12)
 
-    @pytest.fixture(scope="class")
-    def d(self) -> FiscalQuarter:
-        return FiscalQuarter(2017, 1)
-
-    def test_basic(self, a: FiscalMonth) -> None:
-        assert a.fiscal_year == 2016
-        assert a.fiscal_month == 1
-
-    def test_current(self, monkeypatch: MonkeyPatch) -> None:
-        def today() -> FiscalDate:
-            return FiscalDate(2016, 10, 1)
+class TestFiscalMonth:
+    def test_basic(self, fm_2016_1: FiscalMonth) -> None:
+        assert fm_2016_1.fiscal_year == 2016
+        assert fm_2016_1.fiscal_month == 1
 
-        monkeypatch.setattr(FiscalDate, "today", today)
+    @pytest.mark.usefixtures("frozen_today")
+    def test_current(self) -> None:
         current = FiscalMonth.current()
         assert current == FiscalMonth(2017, 1)
 
-    def test_repr(self, a: FiscalMonth) -> None:
-        assert repr(a) == "FiscalMonth(2016, 1)"
+    def test_repr(self, fm_2016_1: FiscalMonth) -> None:
+        assert repr(fm_2016_1) == "FiscalMonth(2016, 1)"
 
-    def test_str(self, a: FiscalMonth) -> None:
-        assert str(a) == "FY2016 FM1"
+    def test_str(self, fm_2016_1: FiscalMonth) -> None:
+        assert str(fm_2016_1) == "FY2016 FM1"
 
     def test_out_of_range(self) -> None:
-        with pytest.raises(ValueError):
-            FiscalMonth(2016, 0)
+        for month in (0, -12):
+            with pytest.raises(ValueError):
+                FiscalMonth(2016, month)
 
-        with pytest.raises(ValueError):
-            FiscalMonth(2016, -12)
-
-    def test_prev_fiscal_year(self, a: FiscalMonth, b: FiscalMonth) -> None:
-        assert a == b.prev_fiscal_month
-        assert a.prev_fiscal_month == FiscalMonth(2015, 12)
+    def test_prev_fiscal_year(
+        self, fm_2016_1: FiscalMonth, fm_2016_2: FiscalMonth
+    ) -> None:
+        assert fm_2016_1 == fm_2016_2.prev_fiscal_month
+        assert fm_2016_1.prev_fiscal_month == FiscalMonth(2015, 12)
 
-    def test_next_fiscal_year(self, a: FiscalMonth, b: FiscalMonth) -> None:
-        assert a.next_fiscal_month == b
+    def test_next_fiscal_year(
+        self, fm_2016_1: FiscalMonth, fm_2016_2: FiscalMonth, fm_2016_12: FiscalMonth
+    ) -> None:
+        assert fm_2016_1.next_fiscal_month == fm_2016_2
+        assert fm_2016_12.next_fiscal_month == FiscalMonth(2017, 1)
 
-    def test_start(self, a: FiscalMonth, c: FiscalMonth) -> None:
-        assert a.start == FiscalYear(a.fiscal_year).start
-        assert c.start == FiscalDateTime(2016, 9, 1, 0, 0, 0)
+    def test_start(self, fm_2016_1: FiscalMonth, fm_2016_12: FiscalMonth) -> None:
+        assert fm_2016_1.start == FiscalYear(fm_2016_1.fiscal_year).start
+        assert fm_2016_12.start == FiscalDateTime(2016, 9, 1, 0, 0, 0)
 
         with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert a.start == datetime.datetime(2015, 10, 1, 0, 0, 0)
+            assert fm_2016_1.start == US_FY2016_START
 
         with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert a.start == datetime.datetime(2016, 4, 6, 0, 0, 0)
-            assert FiscalMonth(2016, 12).start == datetime.datetime(2017, 3, 6, 0, 0, 0)
+            assert fm_2016_1.start == UK_FY2016_START
+            assert FiscalMonth(2016, 12).start == UK_FY2016_M12_START
 
-    def test_end(self, c: FiscalMonth) -> None:
-        assert c.end == FiscalYear(c.fiscal_year).end
+    def test_end(self, fm_2016_12: FiscalMonth) -> None:
+        assert fm_2016_12.end == FiscalYear(fm_2016_12.fiscal_year).end
 
         with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert c.end == datetime.datetime(2016, 9, 30, 23, 59, 59)
+            assert fm_2016_12.end == US_FY2016_END
 
         with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert c.end == datetime.datetime(2017, 4, 5, 23, 59, 59)
-
-    def test_contains(self, a: FiscalMonth, b: FiscalMonth, d: FiscalQuarter) -> None:
-        assert b in b
-        assert a not in d
-        assert b in b
+            assert fm_2016_12.end == UK_FY2016_END
 
-        assert FiscalDateTime(2015, 10, 1, 0, 0, 0) in a
-        assert datetime.datetime(2015, 10, 1, 0, 0, 0) in a
-        assert FiscalDate(2015, 10, 1) in a
-        assert datetime.date(2015, 10, 1) in a
+    def test_cache(self, fm_2016_12: FiscalMonth) -> None:
+        start, end = fm_2016_12.start, fm_2016_12.end
+        assert fm_2016_12.start is start
+        assert fm_2016_12.end is end
 
-    def test_less_than(self, a: FiscalMonth, b: FiscalMonth) -> None:
-        assert a < b
+        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
+            assert fm_2016_12.start == UK_FY2016_M12_START
+            assert fm_2016_12.end == UK_FY2016_END
 
-    def test_less_than_equals(self, a: FiscalMonth, b: FiscalMonth) -> None:
-        assert a <= b
+        assert fm_2016_12.start == start
+        assert fm_2016_12.end == end
 
-    def test_equals(self, b: FiscalMonth) -> None:
-        assert b == b
+    def test_contains(
+        self, fm_2016_1: FiscalMonth, fm_2016_2: FiscalMonth, fq_2017_1: FiscalQuarter
+    ) -> None:
+        assert fm_2016_2 in fm_2016_2
+        assert fm_2016_1 not in fq_2017_1
+        assert fm_2016_2 in fm_2016_2
 
-        with pytest.raises(TypeError):
-            b == 1
+        for date in OCT_1_2015:
+            assert date in fm_2016_1
 
-    def test_not_equals(self, a: FiscalMonth, b: FiscalMonth) -> None:
-        assert a != b
+    @pytest.mark.parametrize("op, lower_higher, higher_lower, same", COMPARISONS)
+    def test_comparison(
+        self,
+        fm_2016_1: FiscalMonth,
+        fm_2016_2: FiscalMonth,
+        op: Comparison,
+        lower_higher: bool,
+        higher_lower: bool,
+        same: bool,
+    ) -> None:
+        assert op(fm_2016_1, fm_2016_2) == lower_higher
+        assert op(fm_2016_2, fm_2016_1) == higher_lower
+        assert op(fm_2016_2, fm_2016_2) == same
 
+    @pytest.mark.parametrize("op", [operator.eq, operator.ne])
+    def test_comparison_wrong_type(
+        self, fm_2016_2: FiscalMonth, op: Comparison
+    ) -> None:
         with pytest.raises(TypeError):
-            a != 1
+            op(fm_2016_2, 1)
+
+    def test_hash(
+        self, fm_2016_1: FiscalMonth, fm_2016_2: FiscalMonth, fm_2016_12: FiscalMonth
+    ) -> None:
+        assert hash(fm_2016_1) == hash(fm_2016_1)
+        assert len({hash(fm_2016_1), hash(fm_2016_2), hash(fm_2016_12)}) == 3
 
-    def test_greater_than(self, a: FiscalMonth, b: FiscalMonth) -> None:
-        assert b > a
+    def test_hash_with_ints(self, fm_2016_1: FiscalMonth) -> None:
+        # Periods can share a set or dict with the int their sort key packs to
+        packed = fm_2016_1._sort_key
+        assert len({packed, fm_2016_1}) == 2
+        assert {packed: "int", fm_2016_1: "period"}[fm_2016_1] == "period"
 
-    def test_greater_than_equals(self, a: FiscalMonth, b: FiscalMonth) -> None:
-        assert b >= a
+    def test_hash_consistency(self) -> None:
+        pairs = list(itertools.product(range(2012, 2023), range(1, 13)))
+        months = [FiscalMonth(*pair) for pair in pairs]
+        assert len(set(months)) == len(pairs)
 
-    def test_hash(self, a: FiscalMonth, b: FiscalMonth, c: FiscalMonth) -> None:
-        assert hash(a) == hash(a)
-        assert hash(a) != hash(b) != hash(c)
+        for (x, x_pair), (y, y_pair) in itertools.product(zip(months, pairs), repeat=2):
+            assert (x == y) == (x_pair == y_pair)
+            assert (hash(x) == hash(y)) == (x_pair == y_pair)
 
 
 class TestFiscalDay:
-    @pytest.fixture(scope="class")
-    def a(self) -> FiscalDay:
-        return FiscalDay(2016, 1)
+    def test_basic(self, fd_2016_1: FiscalDay) -> None:
+        assert fd_2016_1.fiscal_year == 2016
+        assert fd_2016_1.fiscal_day == 1
 
-    @pytest.fixture(scope="class")
-    def b(self) -> FiscalDay:
-        return FiscalDay(2016, 2)
+        assert fd_2016_1.fiscal_month == 1
+        assert fd_2016_1.fiscal_quarter == 1
 
-    @pytest.fixture(scope="class")
-    def c(self) -> FiscalDay:
-        return FiscalDay(2016, 366)
+    def test_calendar_checked(self, fd_2016_366: FiscalDay) -> None:
+        # Whether a fiscal day exists depends on the current fiscal calendar
+        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
+            with pytest.raises(ValueError):
+                FiscalDay(2016, 366)
 
-    @pytest.fixture(scope="class")
-    def d(self) -> FiscalDay:
-        return FiscalDay(2017, 1)
+    @pytest.mark.usefixtures("frozen_today")
+    def test_current(self) -> None:
+        current = FiscalDay.current()
+        assert current == FiscalDay(2017, 1)
 
-    def test_basic(self, a: FiscalDay) -> None:
-        assert a.fiscal_year == 2016
-        assert a.fiscal_day == 1
+    @pytest.mark.usefixtures("frozen_today")
+    def test_current_cache(self, monkeypatch: MonkeyPatch) -> None:
+        assert FiscalDay.current() == FiscalDay(2017, 1)
+        assert FiscalYear.current() == FiscalYear(2017)
 
-        assert a.fiscal_month == 1
-        assert a.fiscal_quarter == 1
+        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
+            assert FiscalDay.current() == FiscalDay(2016, 179)
+            assert FiscalYear.current() == FiscalYear(2016)
 
-    def test_current(self, monkeypatch: MonkeyPatch) -> None:
-        def today() -> FiscalDate:
-            return FiscalDate(2016, 10, 1)
+        def tomorrow() -> FiscalDate:
+            return FiscalDate(2016, 10, 2)
 
-        monkeypatch.setattr(FiscalDate, "today", today)
-        current = FiscalDay.current()
-        assert current == FiscalDay(2017, 1)
+        monkeypatch.setattr(FiscalDate, "today", tomorrow)
+        assert FiscalDay.current() == FiscalDay(2017, 2)
 
-    def test_repr(self, a: FiscalDay) -> None:
-        assert repr(a) == "FiscalDay(2016, 1)"
+    def test_range(
+        self,
+        fd_2016_1: FiscalDay,
+        fd_2016_2: FiscalDay,
+        fd_2016_366: FiscalDay,
+        fd_2017_1: FiscalDay,
+    ) -> None:
+        assert list(FiscalDay.range(fd_2016_1, fd_2016_1)) == []
+        assert list(FiscalDay.range(fd_2016_1, fd_2016_2)) == [fd_2016_1]
+        assert list(FiscalDay.range(fd_2016_366, FiscalDay(2017, 2))) == [
+            fd_2016_366,
+            fd_2017_1,
+        ]
+
+        days = list(FiscalDay.range(fd_2016_1, fd_2017_1))
+        assert len(days) == 366
+        assert days[0] == fd_2016_1
+        assert days[-1] == fd_2016_366
 
-    def test_str(self, a: FiscalDay) -> None:
-        assert str(a) == "FY2016 FD1"
+        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
+            assert len(list(FiscalDay.range(FiscalDay(2016, 1), fd_2017_1))) == 365
 
-    def test_out_of_range(self) -> None:
-        with pytest.raises(ValueError):
-            FiscalDay(2016, 0)
+        # A start day built under another fiscal calendar is still checked
+        with fiscalyear.fiscal_calendar("same", 4, 6):
+            with pytest.raises(ValueError, match="fiscal_day 366 is out of range"):
+                list(FiscalDay.range(fd_2016_366, FiscalDay(2017, 2)))
 
-        with pytest.raises(ValueError):
-            FiscalDay(2016, -364)
+    def test_repr(self, fd_2016_1: FiscalDay) -> None:
+        assert repr(fd_2016_1) == "FiscalDay(2016, 1)"
+
+    def test_str(self, fd_2016_1: FiscalDay) -> None:
+        assert str(fd_2016_1) == "FY2016 FD1"
+
+    def test_out_of_range(self) -> None:
+        for day in (0, -364):
+            with pytest.raises(ValueError):
+                FiscalDay(2016, day)
 
-    def test_prev_fiscal_day(self, a: FiscalDay, b: FiscalDay, d: FiscalDay) -> None:
-        assert a == b.prev_fiscal_day
-        assert a.prev_fiscal_day == FiscalDay(2015, 365)
-        assert d.prev_fiscal_day == FiscalDay(2016, 366)
+    def test_prev_fiscal_day(
+        self, fd_2016_1: FiscalDay, fd_2016_2: FiscalDay, fd_2017_1: FiscalDay
+    ) -> None:
+        assert fd_2016_1 == fd_2016_2.prev_fiscal_day
+        assert fd_2016_1.prev_fiscal_day == FiscalDay(2015, 365)
+        assert fd_2017_1.prev_fiscal_day == FiscalDay(2016, 366)
 
-    def test_next_fiscal_day(self, a: FiscalDay, b: FiscalDay) -> None:
-        assert a.next_fiscal_day == b
+    def test_next_fiscal_day(
+        self,
+        fd_2016_1: FiscalDay,
+        fd_2016_2: FiscalDay,
+        fd_2016_366: FiscalDay,
+        fd_2017_1: FiscalDay,
+    ) -> None:
+        assert fd_2016_1.next_fiscal_day == fd_2016_2
+        assert fd_2016_366.next_fiscal_day == fd_2017_1
+        assert FiscalDay(2017, 365).next_fiscal_day == FiscalDay(2018, 1)
 
-    def test_start(self, a: FiscalDay, c: FiscalDay) -> None:
-        assert a.start == FiscalYear(a.fiscal_year).start
-        assert c.start == FiscalDateTime(2016, 9, 30, 0, 0, 0)
+    def test_start(self, fd_2016_1: FiscalDay, fd_2016_366: FiscalDay) -> None:
+        assert fd_2016_1.start == FiscalYear(fd_2016_1.fiscal_year).start
+        assert fd_2016_366.start == FiscalDateTime(2016, 9, 30, 0, 0, 0)
+        assert isinstance(fd_2016_366.start, FiscalDateTime)
 
         with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert a.start == datetime.datetime(2015, 10, 1, 0, 0, 0)
+            assert fd_2016_1.start == US_FY2016_START
 
         with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert a.start == datetime.datetime(2016, 4, 6, 0, 0, 0)
+            assert fd_2016_1.start == UK_FY2016_START
 
-    def test_end(self, c: FiscalDay) -> None:
-        assert c.end == FiscalYear(c.fiscal_year).end
+    def test_end(self, fd_2016_366: FiscalDay) -> None:
+        assert fd_2016_366.end == FiscalYear(fd_2016_366.fiscal_year).end
 
         with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert c.end == datetime.datetime(2016, 9, 30, 23, 59, 59)
+            assert fd_2016_366.end == US_FY2016_END
 
         with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert c.end == datetime.datetime(2017, 4, 5, 23, 59, 59)
+            assert fd_2016_366.end == UK_FY2016_END
 
     def test_leap_year(self) -> None:
         assert FiscalDate(2016, 1, 1).fiscal_day == 93
@@ -804,161 +988,245 @@ class TestFiscalDay:
         assert FiscalDate(2017, 9, 30).fiscal_day == 365
         assert FiscalDate(2018, 9, 30).fiscal_day == 365
 
-    def test_contains(self, a: FiscalDay, b: FiscalDay, d: FiscalDay) -> None:
-        assert b in b
-        assert a not in d
-
-        assert FiscalDateTime(2015, 10, 1, 0, 0, 0) in a
-        assert datetime.datetime(2015, 10, 1, 0, 0, 0) in a
-        assert FiscalDate(2015, 10, 1) in a
-        assert datetime.date(2015, 10, 1) in a
+    def test_contains(
+        self, fd_2016_1: FiscalDay, fd_2016_2: FiscalDay, fd_2017_1: FiscalDay
+    ) -> None:
+        assert fd_2016_2 in fd_2016_2
+        assert fd_2016_1 not in fd_2017_1
 
-        assert b in FiscalMonth(2016, 1)
-        assert b in FiscalQuarter(2016, 1)
-        assert b in FiscalYear(2016)
+        for date in OCT_1_2015:
+            assert date in fd_2016_1
 
-    def test_less_than(self, a: FiscalDay, b: FiscalDay) -> None:
-        assert a < b
+        assert datetime.date(2015, 10, 2) not in fd_2016_1
+        assert datetime.datetime(2015, 10, 1, 12, 0, 0) in fd_2016_1
 
-    def test_less_than_equals(self, a: FiscalDay, b: FiscalDay) -> None:
-        assert a <= b
+        assert fd_2016_2 in FiscalMonth(2016, 1)
+        assert fd_2016_2 in FiscalQuarter(2016, 1)
+        assert fd_2016_2 in FiscalYear(2016)
 
-    def test_equals(self, b: FiscalDay) -> None:
-        assert b == b
+    @pytest.mark.parametrize("op, lower_higher, higher_lower, same", COMPARISONS)
+    def test_comparison(
+        self,
+        fd_2016_1: FiscalDay,
+        fd_2016_2: FiscalDay,
+        op: Comparison,
+        lower_higher: bool,
+        higher_lower: bool,
+        same: bool,
+    ) -> None:
+        assert op(fd_2016_1, fd_2016_2) == lower_higher
+        assert op(fd_2016_2, fd_2016_1) == higher_lower
+        assert op(fd_2016_2, fd_2016_2) == same
 
+    @pytest.mark.parametrize("op", [operator.eq, operator.ne])
+    def test_comparison_wrong_type(self, fd_2016_2: FiscalDay, op: Comparison) -> None:
         with pytest.raises(TypeError):
-            b == 1
-
-    def test_not_equals(self, a: FiscalDay, b: FiscalDay) -> None:
-        assert a != b
+            op(fd_2016_2, 1)
 
-        with pytest.raises(TypeError):
-            a != 1
+    def test_sort(
+        self,
+        fd_2016_1: FiscalDay,
+        fd_2016_2: FiscalDay,
+        fd_2016_366: FiscalDay,
+        fd_2017_1: FiscalDay,
+    ) -> None:
+        assert fd_2016_366 < fd_2017_1
+        assert sorted([fd_2017_1, fd_2016_366, fd_2016_2, fd_2016_1]) == [
+            fd_2016_1,
+            fd_2016_2,
+            fd_2016_366,
+            fd_2017_1,
+        ]
+
+    def test_hash(
+        self, fd_2016_1: FiscalDay, fd_2016_2: FiscalDay, fd_2017_1: FiscalDay
+    ) -> None:
+        assert hash(fd_2016_1) == hash(fd_2016_1)
+        assert len({hash(fd_2016_1), hash(fd_2016_2), hash(fd_2017_1)}) == 3
 
-    def test_greater_than(self, a: FiscalDay, b: FiscalDay) -> None:
-        assert b > a
+        pairs = list(itertools.product(range(2012, 2023), range(1, 366)))
+        assert len({FiscalDay(*pair) for pair in pairs}) == len(pairs)
 
-    def test_greater_than_equals(self, a: FiscalDay, b: FiscalDay) -> None:
-        assert b >= a
+    def test_hash_with_ints(self, fd_2016_1: FiscalDay) -> None:
+        # Periods can share a set or dict with the int their sort key packs to
+        packed = fd_2016_1._sort_key
+        assert len({packed, fd_2016_1}) == 2
+        assert {packed: "int", fd_2016_1: "period"}[fd_2016_1] == "period"
 
-    def test_hash(self, a: FiscalDay, b: FiscalDay, d: FiscalDay) -> None:
-        assert hash(a) == hash(a)
-        assert hash(a) != hash(b) != hash(d)
+        days = {FiscalDay(2017, 1): "first", FiscalDay(2017, 2): "second"}
+        assert days[FiscalDay(2017, 1)] == "first"
+        assert FiscalDay(2016, 1) not in days
 
 
 class TestFiscalDate:
-    @pytest.fixture(scope="class")
-    def a(self) -> FiscalDate:
-        return FiscalDate(2017, 1, 1)
+    def test_basic(self, date_2017_1_1: FiscalDate) -> None:
+        assert date_2017_1_1.year == 2017
+        assert date_2017_1_1.month == 1
+        assert date_2017_1_1.day == 1
 
-    @pytest.fixture(scope="class")
-    def b(self) -> FiscalDate:
-        return FiscalDate(2017, 11, 15)
+        assert date_2017_1_1.fiscal_year == 2017
+        assert date_2017_1_1.fiscal_month == 4
+        assert date_2017_1_1.fiscal_quarter == 2
 
-    def test_basic(self, a: FiscalDate) -> None:
-        assert a.year == 2017
-        assert a.month == 1
-        assert a.day == 1
+    def test_slots(self, date_2017_1_1: FiscalDate) -> None:
+        date_2017_1_1.fiscal_day
+        assert not hasattr(date_2017_1_1, "__dict__")
 
-        assert a.fiscal_year == 2017
-        assert a.fiscal_month == 4
-        assert a.fiscal_quarter == 2
+    def test_fiscal_periods(
+        self, calendar: Calendar, date_2017_1_1: FiscalDate, date_2017_11_15: FiscalDate
+    ) -> None:
+        january, november = DATE_FISCAL_MONTHS[calendar]
+        assert (date_2017_1_1.fiscal_year, date_2017_1_1.fiscal_month) == january
+        assert (date_2017_11_15.fiscal_year, date_2017_11_15.fiscal_month) == november
+
+    def test_cache(self, date_2017_1_1: FiscalDate) -> None:
+        fields = (
+            date_2017_1_1.fiscal_year,
+            date_2017_1_1.fiscal_quarter,
+            date_2017_1_1.fiscal_month,
+            date_2017_1_1.fiscal_day,
+        )
 
-    def test_fiscal_periods(self, a: FiscalDate, b: FiscalDate) -> None:
+        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
+            assert date_2017_1_1.fiscal_year == 2016
+            assert date_2017_1_1.fiscal_month == 9
+            assert date_2017_1_1.fiscal_day == 271
+
+        assert (
+            date_2017_1_1.fiscal_year,
+            date_2017_1_1.fiscal_quarter,
+            date_2017_1_1.fiscal_month,
+            date_2017_1_1.fiscal_day,
+        ) == fields
+
+    def test_quarter_boundary(self) -> None:
         with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert a.fiscal_year == 2017
-            assert a.fiscal_month == 4
-            assert b.fiscal_year == 2018
-            assert b.fiscal_month == 2
+            assert FiscalDate(2016, 12, 31).fiscal_day == 92
+            assert FiscalDate(2016, 12, 31).fiscal_quarter == 1
+            assert FiscalDate(2017, 1, 1).fiscal_day == 93
+            assert FiscalDate(2017, 1, 1).fiscal_quarter == 2
 
         with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert a.fiscal_year == 2016
-            assert a.fiscal_month == 9
-            assert b.fiscal_year == 2017
-            assert b.fiscal_month == 8
+            assert FiscalDate(2016, 7, 5).fiscal_quarter == 1
+            assert FiscalDate(2016, 7, 6).fiscal_quarter == 2
+            assert FiscalDate(2017, 4, 5).fiscal_quarter == 4
+
+    def test_year_boundary(self) -> None:
+        with fiscalyear.fiscal_calendar(*US_FEDERAL):
+            assert FiscalDate(2016, 9, 30).fiscal_year == 2016
+            assert FiscalDate(2016, 10, 1).fiscal_year == 2017
 
-    def test_prev_fiscal_year(self, a: FiscalDate) -> None:
-        assert a.prev_fiscal_year == FiscalYear(2016)
+        with fiscalyear.fiscal_calendar("same", 1, 1):
+            assert FiscalDate(2016, 12, 31).fiscal_year == 2016
+            assert FiscalDate(2017, 1, 1).fiscal_year == 2017
+            assert FiscalDate(2017, 1, 1).fiscal_month == 1
 
-    def test_next_fiscal_year(self, a: FiscalDate) -> None:
-        assert a.next_fiscal_year == FiscalYear(2018)
+        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
+            assert FiscalDate(2017, 4, 5).fiscal_year == 2016
+            assert FiscalDate(2017, 4, 6).fiscal_year == 2017
 
-    def test_prev_fiscal_quarter(self, a: FiscalDate, b: FiscalDate) -> None:
-        assert a.prev_fiscal_quarter == FiscalQuarter(2017, 1)
-        assert b.prev_fiscal_quarter == FiscalQuarter(2017, 4)
+    @pytest.mark.parametrize("start_year", ["previous", "same"])
+    @pytest.mark.parametrize("start_month", range(1, 13))
+    @pytest.mark.parametrize("start_day", [1, 28])
+    def test_fiscal_period_containment(
+        self, start_year: str, start_month: int, start_day: int
+    ) -> None:
+        with fiscalyear.fiscal_calendar(start_year, start_month, start_day):
+            for month in range(1, 13):
+                for day in [1, 27, 28]:
+                    date = FiscalDate(2016, month, day)
+                    assert date in FiscalMonth(date.fiscal_year, date.fiscal_month)
+                    assert date in FiscalYear(date.fiscal_year)
 
-    def test_next_fiscal_quarter(self, a: FiscalDate, b: FiscalDate) -> None:
-        assert a.next_fiscal_quarter == FiscalQuarter(2017, 3)
-        assert b.next_fiscal_quarter == FiscalQuarter(2018, 2)
+    def test_prev_fiscal_year(self, date_2017_1_1: FiscalDate) -> None:
+        assert date_2017_1_1.prev_fiscal_year == FiscalYear(2016)
 
-    def test_prev_fiscal_month(self, a: FiscalDate) -> None:
-        assert a.prev_fiscal_month == FiscalMonth(2017, 3)
+    def test_next_fiscal_year(self, date_2017_1_1: FiscalDate) -> None:
+        assert date_2017_1_1.next_fiscal_year == FiscalYear(2018)
 
-    def test_next_fiscal_month(self, a: FiscalDate) -> None:
-        assert a.next_fiscal_month == FiscalMonth(2017, 5)
+    def test_prev_fiscal_quarter(
+        self, date_2017_1_1: FiscalDate, date_2017_11_15: FiscalDate
+    ) -> None:
+        assert date_2017_1_1.prev_fiscal_quarter == FiscalQuarter(2017, 1)
+        assert date_2017_11_15.prev_fiscal_quarter == FiscalQuarter(2017, 4)
 
-    def test_prev_fiscal_day(self, a: FiscalDate) -> None:
-        assert a.prev_fiscal_day == FiscalDay(2017, 92)
+    def test_next_fiscal_quarter(
+        self, date_2017_1_1: FiscalDate, date_2017_11_15: FiscalDate
+    ) -> None:
+        assert date_2017_1_1.next_fiscal_quarter == FiscalQuarter(2017, 3)
+        assert date_2017_11_15.next_fiscal_quarter == FiscalQuarter(2018, 2)
 
-    def test_next_fiscal_day(self, a: FiscalDate) -> None:
-        assert a.next_fiscal_day == FiscalDay(2017, 94)
+    def test_prev_fiscal_month(self, date_2017_1_1: FiscalDate) -> None:
+        assert date_2017_1_1.prev_fiscal_month == FiscalMonth(2017, 3)
 
+    def test_next_fiscal_month(self, date_2017_1_1: FiscalDate) -> None:
+        assert date_2017_1_1.next_fiscal_month == FiscalMonth(2017, 5)
 
-class TestFiscalDateTime:
-    @pytest.fixture(scope="class")
-    def a(self) -> FiscalDateTime:
-        return FiscalDateTime(2017, 1, 1, 0, 0, 0)
-
-    @pytest.fixture(scope="class")
-    def b(self) -> FiscalDateTime:
-        return FiscalDateTime(2017, 11, 15, 12, 4, 30)
-
-    def test_basic(self, a: FiscalDateTime) -> None:
-        assert a.year == 2017
-        assert a.month == 1
-        assert a.day == 1
-        assert a.hour == 0
-        assert a.minute == 0
-        assert a.second == 0
-
-        assert a.fiscal_year == 2017
-        assert a.fiscal_quarter == 2
-
-    def test_fiscal_periods(self, a: FiscalDateTime, b: FiscalDateTime) -> None:
-        with fiscalyear.fiscal_calendar(*US_FEDERAL):
-            assert a.fiscal_year == 2017
-            assert a.fiscal_month == 4
-            assert b.fiscal_year == 2018
-            assert b.fiscal_month == 2
+    def test_prev_fiscal_day(self, date_2017_1_1: FiscalDate) -> None:
+        assert date_2017_1_1.prev_fiscal_day == FiscalDay(2017, 92)
 
-        with fiscalyear.fiscal_calendar(*UK_PERSONAL):
-            assert a.fiscal_year == 2016
-            assert a.fiscal_month == 9
-            assert b.fiscal_year == 2017
-            assert b.fiscal_month == 8
+    def test_next_fiscal_day(self, date_2017_1_1: FiscalDate) -> None:
+        assert date_2017_1_1.next_fiscal_day == FiscalDay(2017, 94)
 
-    def test_prev_fiscal_year(self, a: FiscalDateTime) -> None:
-        assert a.prev_fiscal_year == FiscalYear(2016)
 
-    def test_next_fiscal_year(self, a: FiscalDateTime) -> None:
-        assert a.next_fiscal_year == FiscalYear(2018)
+class TestFiscalDateTime:
+    def test_basic(self, datetime_2017_1_1: FiscalDateTime) -> None:
+        assert datetime_2017_1_1.year == 2017
+        assert datetime_2017_1_1.month == 1
+        assert datetime_2017_1_1.day == 1
+        assert datetime_2017_1_1.hour == 0
+        assert datetime_2017_1_1.minute == 0
+        assert datetime_2017_1_1.second == 0
+
+        assert datetime_2017_1_1.fiscal_year == 2017
+        assert datetime_2017_1_1.fiscal_quarter == 2
+
+    def test_slots(self, datetime_2017_1_1: FiscalDateTime) -> None:
+        datetime_2017_1_1.fiscal_day
+        assert not hasattr(datetime_2017_1_1, "__dict__")
+
+    def test_fiscal_periods(
+        self,
+        calendar: Calendar,
+        datetime_2017_1_1: FiscalDateTime,
+        datetime_2017_11_15: FiscalDateTime,
+    ) -> None:
+        january, november = DATE_FISCAL_MONTHS[calendar]
+        assert (
+            datetime_2017_1_1.fiscal_year,
+            datetime_2017_1_1.fiscal_month,
+        ) == january
+        assert (
+            datetime_2017_11_15.fiscal_year,
+            datetime_2017_11_15.fiscal_month,
+        ) == november
+
+    def test_prev_fiscal_year(self, datetime_2017_1_1: FiscalDateTime) -> None:
+        assert datetime_2017_1_1.prev_fiscal_year == FiscalYear(2016)
+
+    def test_next_fiscal_year(self, datetime_2017_1_1: FiscalDateTime) -> None:
+        assert datetime_2017_1_1.next_fiscal_year == FiscalYear(2018)
 
-    def test_prev_fiscal_quarter(self, a: FiscalDateTime, b: FiscalDateTime) -> None:
-        assert a.prev_fiscal_quarter == FiscalQuarter(2017, 1)
-        assert b.prev_fiscal_quarter == FiscalQuarter(2017, 4)
+    def test_prev_fiscal_quarter(
+        self, datetime_2017_1_1: FiscalDateTime, datetime_2017_11_15: FiscalDateTime
+    ) -> None:
+        assert datetime_2017_1_1.prev_fiscal_quarter == FiscalQuarter(2017, 1)
+        assert datetime_2017_11_15.prev_fiscal_quarter == FiscalQuarter(2017, 4)
 
-    def test_next_fiscal_quarter(self, a: FiscalDateTime, b: FiscalDateTime) -> None:
-        assert a.next_fiscal_quarter == FiscalQuarter(2017, 3)
-        assert b.next_fiscal_quarter == FiscalQuarter(2018, 2)
+    def test_next_fiscal_quarter(
+        self, datetime_2017_1_1: FiscalDateTime, datetime_2017_11_15: FiscalDateTime
+    ) -> None:
+        assert datetime_2017_1_1.next_fiscal_quarter == FiscalQuarter(2017, 3)
+        assert datetime_2017_11_15.next_fiscal_quarter == FiscalQuarter(2018, 2)
 
-    def test_prev_fiscal_month(self, a: FiscalDateTime) -> None:
-        assert a.prev_fiscal_month == FiscalMonth(2017, 3)
+    def test_prev_fiscal_month(self, datetime_2017_1_1: FiscalDateTime) -> None:
+        assert datetime_2017_1_1.prev_fiscal_month == FiscalMonth(2017, 3)
 
-    def test_next_fiscal_month(self, a: FiscalDateTime) -> None:
-        assert a.next_fiscal_month == FiscalMonth(2017, 5)
+    def test_next_fiscal_month(self, datetime_2017_1_1: FiscalDateTime) -> None:
+        assert datetime_2017_1_1.next_fiscal_month == FiscalMonth(2017, 5)
 
-    def test_prev_fiscal_day(self, a: FiscalDateTime) -> None:
-        assert a.prev_fiscal_day == FiscalDay(2017, 92)
+    def test_prev_fiscal_day(self, datetime_2017_1_1: FiscalDateTime) -> None:
+        assert datetime_2017_1_1.prev_fiscal_day == FiscalDay(2017, 92)
 
-    def test_next_fiscal_day(self, a: FiscalDateTime) -> None:
-        assert a.next_fiscal_day == FiscalDay(2017, 94)
+    def test_next_fiscal_day(self, datetime_2017_1_1: FiscalDateTime) -> None:
+        assert datetime_2017_1_1.next_fiscal_day == FiscalDay(2017, 94)